@@ -23,6 +23,7 @@ from __future__ import annotations
 import json
 import logging
 import os
+import threading
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -57,6 +58,10 @@ NAM_VST3_SEARCH_PATHS: list[str | Path] = [
 # Cached VST3 plugin path (None = not yet searched, "" = not found)
 _nam_vst3_path: str | None = None
 
+# Loaded NAM VST3 plugins keyed by (vst3 path, model path). Plugin instances
+# carry processing state, so each thread keeps its own.
+_nam_plugins = threading.local()
+
 
 class AudioProcessingError(Exception):
     """Error during audio processing."""
@@ -154,6 +159,44 @@ def save_audio(
     return path
 
 
+def trim_silence_array(
+    audio: NDArray[np.float32],
+    sample_rate: int,
+    threshold_db: float = -50.0,
+    min_silence: float = 0.05,
+) -> NDArray[np.float32]:
+    """
+    Trim leading and trailing silence from an in-memory audio array.
+
+    In-process equivalent of the FFmpeg silenceremove trim: keeps up to
+    min_silence seconds of silence before the first and after the last
+    sample above the threshold.
+
+    Args:
+        audio: Audio data, 1D or 2D (channels, samples)
+        sample_rate: Sample rate in Hz
+        threshold_db: Silence threshold in dB (default -50dB)
+        min_silence: Seconds of silence to keep at each end
+
+    Returns:
+        View of the audio cropped to the non-silent region
+    """
+    envelope = np.abs(audio).max(axis=0) if audio.ndim > 1 else np.abs(audio)
+    active = envelope > 10 ** (threshold_db / 20)
+
+    if not active.any():
+        return audio[..., :0]
+
+    first = int(np.argmax(active))
+    last = len(active) - 1 - int(np.argmax(active[::-1]))
+
+    pad = int(min_silence * sample_rate)
+    start = max(0, first - pad)
+    end = min(len(active), last + 1 + pad)
+
+    return audio[..., start:end]
+
+
 def load_nam_via_vst3(
     model_path: Path,
     vst3_path: str | None = None,
@@ -182,6 +225,16 @@ def load_nam_via_vst3(
     if not model_path.exists():
         raise AudioProcessingError(f"NAM model not found: {model_path}")
 
+    # Reuse a plugin already loaded with this model on this thread
+    cache: dict[tuple[str, Path], pedalboard.Plugin] | None = getattr(_nam_plugins, "cache", None)
+    if cache is None:
+        cache = {}
+        _nam_plugins.cache = cache
+
+    cache_key = (vst3_path, model_path.resolve())
+    if cache_key in cache:
+        return cache[cache_key]
+
     try:
         # Import here to avoid circular dependency
         from guitar_tone_shootout.preset import generate_preset_bytes
@@ -198,6 +251,7 @@ def load_nam_via_vst3(
             plugin.irtoggle = False
 
         logger.debug(f"Loaded NAM model via VST3: {model_path.name}")
+        cache[cache_key] = plugin
         return plugin
 
     except Exception as e:
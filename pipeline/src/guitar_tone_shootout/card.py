@@ -0,0 +1,315 @@
+"""In-process rendering of segment title cards with Pillow.
+
+Draws the layout of templates/comparison.html directly: diagonal gradient
+background, comparison/chain header, a Guitar -> Pickup -> Amp -> Cab row of
+signal blocks, the author and a footer. Rendering a card this way takes tens
+of milliseconds, versus starting and laying out a headless browser page.
+
+The HTML/Playwright renderer remains available for custom templates and
+pixel-exact output (emoji icons, CSS effects such as glows and blurs).
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Card geometry (matches the 1920x1080 template body)
+CARD_WIDTH = 1920
+CARD_HEIGHT = 1080
+_CONTAINER_WIDTH = 1600
+_SECTION_GAP = 50
+
+# Template colors
+_GRADIENT_STOPS = ((0.0, "#1a1a2e"), (0.5, "#16213e"), (1.0, "#0f3460"))
+_ACCENT = (233, 69, 96, 255)  # #e94560
+_WHITE = (255, 255, 255, 255)
+_BLOCK_FILL = (255, 255, 255, 13)  # rgba(255, 255, 255, 0.05)
+_BLOCK_BORDER = (255, 255, 255, 26)  # rgba(255, 255, 255, 0.1)
+
+# Signal block layout
+_BLOCK_MIN_WIDTH = 300
+_BLOCK_MAX_TEXT_WIDTH = 360
+_BLOCK_PADDING_X = 40
+_BLOCK_PADDING_Y = 30
+_BLOCK_GAP = 30
+
+# Fonts tried in order; Pillow searches the system font directories
+_REGULAR_FONTS = ("DejaVuSans.ttf", "Arial.ttf", "LiberationSans-Regular.ttf")
+_BOLD_FONTS = ("DejaVuSans-Bold.ttf", "Arial Bold.ttf", "LiberationSans-Bold.ttf")
+
+_Font = ImageFont.FreeTypeFont | ImageFont.ImageFont
+_Color = tuple[int, int, int, int]
+
+
+@dataclass(frozen=True)
+class CardContent:
+    """Text shown on a segment title card (the comparison template variables)."""
+
+    comparison_name: str
+    signal_chain_name: str
+    signal_chain_description: str
+    guitar: str
+    pickup: str
+    amp_name: str
+    amp_source: str
+    cab_name: str
+    cab_source: str
+    author: str
+
+
+def render_card(content: CardContent, output_path: Path) -> Path:
+    """
+    Render a segment title card to an image file.
+
+    Args:
+        content: Text to place on the card
+        output_path: Output image path (format from suffix, e.g. .png or .jpg)
+
+    Returns:
+        Path to the rendered image
+    """
+    logger.debug(f"Rendering card with Pillow: {output_path}")
+
+    image = _gradient_background()
+    overlay = Image.new("RGBA", image.size, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(overlay)
+    center_x = CARD_WIDTH // 2
+
+    header = _Header(content)
+    blocks = [
+        _SignalBlock("Guitar", content.guitar, ""),
+        _SignalBlock("Pickup", content.pickup, ""),
+        _SignalBlock("Amp Model", content.amp_name, content.amp_source, active=True),
+        _SignalBlock("Cabinet IR", content.cab_name, content.cab_source, active=True),
+    ]
+    block_height = max(block.height for block in blocks)
+    meta_label_font = _font(12)
+    meta_value_font = _font(20)
+    meta_height = _line_height(meta_label_font) + 5 + _line_height(meta_value_font)
+
+    # Header, signal chain and meta info stacked and vertically centered
+    total_height = header.height + 10 + _SECTION_GAP + block_height + _SECTION_GAP + 10
+    total_height += meta_height
+    y = (CARD_HEIGHT - total_height) // 2
+
+    header.draw(draw, center_x, y)
+    y += header.height + 10 + _SECTION_GAP
+
+    _draw_signal_chain(draw, blocks, center_x, y, block_height)
+    y += block_height + _SECTION_GAP + 10
+
+    # Meta info
+    _draw_centered(draw, "AUTHOR", meta_label_font, (center_x, y), (102, 102, 102, 255), spacing=2)
+    y += _line_height(meta_label_font) + 5
+    author = _fit_text(content.author, meta_value_font, _CONTAINER_WIDTH)
+    _draw_centered(draw, author, meta_value_font, (center_x, y), (204, 204, 204, 255))
+
+    # Footer pinned to the bottom
+    footer_font = _font(14)
+    footer_y = CARD_HEIGHT - 30 - _line_height(footer_font)
+    footer = "Generated with Guitar Tone Shootout"
+    _draw_centered(draw, footer, footer_font, (center_x, footer_y), (85, 85, 85, 255))
+
+    image.alpha_composite(overlay)
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    image.convert("RGB").save(output_path, quality=90)
+    return output_path
+
+
+class _Header:
+    """Comparison name, signal chain name and optional description."""
+
+    def __init__(self, content: CardContent) -> None:
+        self.title_font = _font(56, bold=True)
+        self.chain_font = _font(42, bold=True)
+        self.description_font = _font(24)
+
+        self.title = _fit_text(
+            content.comparison_name.upper(), self.title_font, _CONTAINER_WIDTH, spacing=4
+        )
+        self.chain_name = _fit_text(content.signal_chain_name, self.chain_font, _CONTAINER_WIDTH)
+        self.description = _fit_text(
+            content.signal_chain_description, self.description_font, _CONTAINER_WIDTH
+        )
+
+        self.height = _line_height(self.title_font) + 15 + _line_height(self.chain_font)
+        if self.description:
+            self.height += 10 + _line_height(self.description_font)
+
+    def draw(self, draw: ImageDraw.ImageDraw, center_x: int, y: int) -> None:
+        """Draw the header with its top edge at y."""
+        _draw_centered(draw, self.title, self.title_font, (center_x, y), _ACCENT, spacing=4)
+        y += _line_height(self.title_font) + 15
+        _draw_centered(draw, self.chain_name, self.chain_font, (center_x, y), _WHITE)
+        if self.description:
+            y += _line_height(self.chain_font) + 10
+            _draw_centered(
+                draw, self.description, self.description_font, (center_x, y), (160, 160, 160, 255)
+            )
+
+
+def _draw_signal_chain(
+    draw: ImageDraw.ImageDraw, blocks: list[_SignalBlock], center_x: int, y: int, height: int
+) -> None:
+    """Draw the signal blocks in a centered row joined by arrows."""
+    arrow_font = _font(36)
+    arrow_width = int(arrow_font.getlength("→"))
+    row_width = sum(block.width for block in blocks)
+    row_width += (len(blocks) - 1) * (arrow_width + 2 * _BLOCK_GAP)
+
+    x = center_x - row_width // 2
+    for i, block in enumerate(blocks):
+        block.draw(draw, x, y, height)
+        x += block.width
+        if i < len(blocks) - 1:
+            arrow_y = y + (height - _line_height(arrow_font)) // 2
+            draw.text((x + _BLOCK_GAP, arrow_y), "→", font=arrow_font, fill=_ACCENT)
+            x += arrow_width + 2 * _BLOCK_GAP
+
+
+class _SignalBlock:
+    """A labelled box in the signal chain row (label, value, optional source)."""
+
+    def __init__(self, label: str, value: str, source: str, active: bool = False) -> None:
+        self.label_font = _font(14)
+        self.value_font = _font(26, bold=True)
+        self.source_font = _font(14)
+
+        self.label = label.upper()
+        self.value = _fit_text(value, self.value_font, _BLOCK_MAX_TEXT_WIDTH)
+        self.source = _fit_text(source, self.source_font, _BLOCK_MAX_TEXT_WIDTH)
+        self.active = active
+
+        text_width = max(
+            _text_width(self.label, self.label_font, spacing=2),
+            _text_width(self.value, self.value_font),
+            _text_width(self.source, self.source_font),
+        )
+        self.width = max(_BLOCK_MIN_WIDTH, text_width + 2 * _BLOCK_PADDING_X)
+
+        self.height = 2 * _BLOCK_PADDING_Y + _line_height(self.label_font) + 8
+        self.height += _line_height(self.value_font)
+        if self.source:
+            self.height += 8 + _line_height(self.source_font)
+
+    def draw(self, draw: ImageDraw.ImageDraw, x: int, y: int, height: int) -> None:
+        """Draw the block at (x, y), stretched to the row height."""
+        border = _ACCENT if self.active else _BLOCK_BORDER
+        draw.rounded_rectangle(
+            (x, y, x + self.width, y + height), radius=16, fill=_BLOCK_FILL, outline=border, width=2
+        )
+
+        center_x = x + self.width // 2
+        text_y = y + _BLOCK_PADDING_Y
+        _draw_centered(
+            draw, self.label, self.label_font, (center_x, text_y), (136, 136, 136, 255), spacing=2
+        )
+        text_y += _line_height(self.label_font) + 8
+        _draw_centered(draw, self.value, self.value_font, (center_x, text_y), _WHITE)
+        if self.source:
+            text_y += _line_height(self.value_font) + 8
+            _draw_centered(
+                draw, self.source, self.source_font, (center_x, text_y), (102, 102, 102, 255)
+            )
+
+
+@lru_cache(maxsize=1)
+def _gradient_pixels() -> bytes:
+    """RGB bytes of the 135deg background gradient (computed once per process)."""
+    stops = [(position, _hex_to_rgb(color)) for position, color in _GRADIENT_STOPS]
+    positions = np.array([position for position, _ in stops])
+    colors = np.array([rgb for _, rgb in stops], dtype=np.float32)
+
+    # 135deg CSS gradient runs from the top-left to the bottom-right corner
+    ys, xs = np.mgrid[0:CARD_HEIGHT, 0:CARD_WIDTH].astype(np.float32)
+    t = (xs + ys) / (CARD_WIDTH + CARD_HEIGHT - 2)
+
+    rgb = np.stack([np.interp(t, positions, colors[:, c]) for c in range(3)], axis=-1)
+    return np.round(rgb).astype(np.uint8).tobytes()
+
+
+def _gradient_background() -> Image.Image:
+    """New RGBA image filled with the background gradient."""
+    image = Image.frombytes("RGB", (CARD_WIDTH, CARD_HEIGHT), _gradient_pixels())
+    return image.convert("RGBA")
+
+
+def _hex_to_rgb(color: str) -> tuple[int, int, int]:
+    """Convert '#rrggbb' to an (r, g, b) tuple."""
+    value = color.lstrip("#")
+    return int(value[0:2], 16), int(value[2:4], 16), int(value[4:6], 16)
+
+
+@lru_cache(maxsize=32)
+def _font(size: int, bold: bool = False) -> _Font:
+    """Load a TrueType font at the given size, falling back to Pillow's default."""
+    for name in _BOLD_FONTS if bold else _REGULAR_FONTS:
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    logger.debug("No TrueType font found, using Pillow default font")
+    return ImageFont.load_default(size)
+
+
+def _line_height(font: _Font) -> int:
+    """Height of a line of text (ascent + descent) for the font."""
+    _, top, _, bottom = font.getbbox("Ag")
+    return int(bottom - top)
+
+
+def _text_width(text: str, font: _Font, spacing: int = 0) -> int:
+    """Rendered width of text, including extra letter spacing."""
+    if not text:
+        return 0
+    return int(font.getlength(text)) + spacing * (len(text) - 1)
+
+
+def _fit_text(text: str, font: _Font, max_width: int, spacing: int = 0) -> str:
+    """Truncate text with an ellipsis so it fits within max_width."""
+    if _text_width(text, font, spacing) <= max_width:
+        return text
+    while text and _text_width(text + "…", font, spacing) > max_width:
+        text = text[:-1]
+    return text.rstrip() + "…"
+
+
+def _draw_centered(
+    draw: ImageDraw.ImageDraw,
+    text: str,
+    font: _Font,
+    position: tuple[int, int],
+    fill: _Color,
+    *,
+    spacing: int = 0,
+) -> None:
+    """Draw a line of text horizontally centered on position's x, with its top at y."""
+    if not text:
+        return
+
+    center_x, y = position
+
+    # Offset so the top of the glyph box sits at y
+    top = font.getbbox("Ag")[1]
+    x = center_x - _text_width(text, font, spacing) / 2
+
+    if spacing == 0:
+        draw.text((x, y - top), text, font=font, fill=fill)
+        return
+
+    # Pillow has no letter-spacing, so place characters individually
+    for char in text:
+        draw.text((x, y - top), char, font=font, fill=fill)
+        x += font.getlength(char) + spacing
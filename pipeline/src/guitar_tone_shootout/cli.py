@@ -37,7 +37,13 @@ def main() -> None:
     default=None,
     help="Trim DI tracks to this duration in seconds (e.g., 4.0 for 4 seconds)",
 )
-def process(ini_file: Path, duration: float | None) -> None:
+@click.option(
+    "--html-renderer",
+    is_flag=True,
+    default=False,
+    help="Render segment images from templates/comparison.html with Playwright (slower)",
+)
+def process(ini_file: Path, duration: float | None, html_renderer: bool) -> None:
     """Process a comparison INI file and generate outputs."""
     logger.info(f"Processing: {ini_file}")
     if duration:
@@ -45,7 +51,9 @@ def process(ini_file: Path, duration: float | None) -> None:
 
     try:
         comparison = load_comparison(ini_file)
-        process_comparison(comparison, duration=duration)
+        process_comparison(
+            comparison, duration=duration, renderer="html" if html_renderer else "pillow"
+        )
         logger.info("✓ Processing complete")
     except Exception as e:
         logger.error(f"Processing failed: {e}")
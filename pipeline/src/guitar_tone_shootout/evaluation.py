@@ -26,14 +26,22 @@ import json
 import logging
 import os
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+import numpy as np
 from pydantic import BaseModel, Field
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
-from guitar_tone_shootout.metrics import AudioMetrics
+    from numpy.typing import NDArray
+
+from guitar_tone_shootout.metrics import (
+    AdvancedMetrics,
+    AudioMetrics,
+    CoreMetrics,
+    SpectralMetrics,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -53,8 +61,24 @@ ATTACK_TIME_THRESHOLD_MS = 5.0  # ms difference to note attack change
 DECAY_RATE_THRESHOLD_DB_S = 5.0  # dB/s difference to note sustain change
 TRANSIENT_DENSITY_THRESHOLD = 0.5  # transients/s difference to note
 
-
-@dataclass
+# (group, field) columns averaged across segments by compute_shootout_averages
+_METRIC_FIELDS: tuple[tuple[str, str], ...] = (
+    ("core", "rms_dbfs"),
+    ("core", "peak_dbfs"),
+    ("core", "crest_factor_db"),
+    ("core", "dynamic_range_db"),
+    ("spectral", "spectral_centroid_hz"),
+    ("spectral", "bass_energy_ratio"),
+    ("spectral", "mid_energy_ratio"),
+    ("spectral", "treble_energy_ratio"),
+    ("advanced", "lufs_integrated"),
+    ("advanced", "transient_density"),
+    ("advanced", "attack_time_ms"),
+    ("advanced", "sustain_decay_rate_db_s"),
+)
+
+
+@dataclass(frozen=True)
 class MetricsDelta:
     """Computed differences between segment and shootout average metrics.
 
@@ -231,57 +255,11 @@ def compute_shootout_averages(
         msg = "At least one set of metrics is required to compute averages"
         raise ValueError(msg)
 
-    count = len(all_metrics)
-
-    # Compute averages for each metric
-    avg_rms = sum(m.core.rms_dbfs for m in all_metrics) / count
-    avg_peak = sum(m.core.peak_dbfs for m in all_metrics) / count
-    avg_crest = sum(m.core.crest_factor_db for m in all_metrics) / count
-    avg_dynamic = sum(m.core.dynamic_range_db for m in all_metrics) / count
-
-    avg_centroid = sum(m.spectral.spectral_centroid_hz for m in all_metrics) / count
-    avg_bass = sum(m.spectral.bass_energy_ratio for m in all_metrics) / count
-    avg_mid = sum(m.spectral.mid_energy_ratio for m in all_metrics) / count
-    avg_treble = sum(m.spectral.treble_energy_ratio for m in all_metrics) / count
-
-    avg_lufs = sum(m.advanced.lufs_integrated for m in all_metrics) / count
-    avg_transient = sum(m.advanced.transient_density for m in all_metrics) / count
-    avg_attack = sum(m.advanced.attack_time_ms for m in all_metrics) / count
-    avg_decay = sum(m.advanced.sustain_decay_rate_db_s for m in all_metrics) / count
-
-    # Use first metrics for duration/sample rate (should be same for all)
-    avg_duration = sum(m.duration_seconds for m in all_metrics) / count
-    sample_rate = all_metrics[0].sample_rate
-
-    # Import here to avoid circular import
-    from guitar_tone_shootout.metrics import (
-        AdvancedMetrics,
-        CoreMetrics,
-        SpectralMetrics,
-    )
+    means = _metrics_matrix(all_metrics).mean(axis=0)
+    avg_duration = sum(m.duration_seconds for m in all_metrics) / len(all_metrics)
 
-    return AudioMetrics(
-        duration_seconds=avg_duration,
-        sample_rate=sample_rate,
-        core=CoreMetrics(
-            rms_dbfs=avg_rms,
-            peak_dbfs=avg_peak,
-            crest_factor_db=avg_crest,
-            dynamic_range_db=avg_dynamic,
-        ),
-        spectral=SpectralMetrics(
-            spectral_centroid_hz=avg_centroid,
-            bass_energy_ratio=avg_bass,
-            mid_energy_ratio=avg_mid,
-            treble_energy_ratio=avg_treble,
-        ),
-        advanced=AdvancedMetrics(
-            lufs_integrated=avg_lufs,
-            transient_density=avg_transient,
-            attack_time_ms=avg_attack,
-            sustain_decay_rate_db_s=avg_decay,
-        ),
-    )
+    # Use first metrics for sample rate (should be same for all)
+    return _metrics_from_values(means, avg_duration, all_metrics[0].sample_rate)
 
 
 def compute_metrics_std(
@@ -297,112 +275,40 @@ def compute_metrics_std(
     Returns:
         AudioMetrics with standard deviation values
     """
-    import math
-
     if len(all_metrics) < 2:
         # Return zeros for single sample
-        from guitar_tone_shootout.metrics import (
-            AdvancedMetrics,
-            CoreMetrics,
-            SpectralMetrics,
-        )
+        sample_rate = all_metrics[0].sample_rate if all_metrics else 44100
+        return _metrics_from_values(np.zeros(len(_METRIC_FIELDS)), 0.0, sample_rate)
 
-        return AudioMetrics(
-            duration_seconds=0.0,
-            sample_rate=all_metrics[0].sample_rate if all_metrics else 44100,
-            core=CoreMetrics(
-                rms_dbfs=0.0, peak_dbfs=0.0, crest_factor_db=0.0, dynamic_range_db=0.0
-            ),
-            spectral=SpectralMetrics(
-                spectral_centroid_hz=0.0,
-                bass_energy_ratio=0.0,
-                mid_energy_ratio=0.0,
-                treble_energy_ratio=0.0,
-            ),
-            advanced=AdvancedMetrics(
-                lufs_integrated=0.0,
-                transient_density=0.0,
-                attack_time_ms=0.0,
-                sustain_decay_rate_db_s=0.0,
-            ),
-        )
+    deviations = _metrics_matrix(all_metrics) - _metrics_matrix([mean_metrics])
+    stds = np.sqrt(np.mean(deviations**2, axis=0))
 
-    count = len(all_metrics)
+    # Duration deviation is not meaningful
+    return _metrics_from_values(stds, 0.0, all_metrics[0].sample_rate)
 
-    def std(values: list[float], mean: float) -> float:
-        variance = sum((v - mean) ** 2 for v in values) / count
-        return math.sqrt(variance)
 
-    std_rms = std([m.core.rms_dbfs for m in all_metrics], mean_metrics.core.rms_dbfs)
-    std_peak = std([m.core.peak_dbfs for m in all_metrics], mean_metrics.core.peak_dbfs)
-    std_crest = std(
-        [m.core.crest_factor_db for m in all_metrics], mean_metrics.core.crest_factor_db
-    )
-    std_dynamic = std(
-        [m.core.dynamic_range_db for m in all_metrics], mean_metrics.core.dynamic_range_db
+def _metrics_matrix(all_metrics: Sequence[AudioMetrics]) -> NDArray[np.float64]:
+    """Stack the _METRIC_FIELDS values of each AudioMetrics into an (N, F) matrix."""
+    return np.array(
+        [[getattr(getattr(m, group), name) for group, name in _METRIC_FIELDS] for m in all_metrics],
+        dtype=np.float64,
     )
 
-    std_centroid = std(
-        [m.spectral.spectral_centroid_hz for m in all_metrics],
-        mean_metrics.spectral.spectral_centroid_hz,
-    )
-    std_bass = std(
-        [m.spectral.bass_energy_ratio for m in all_metrics],
-        mean_metrics.spectral.bass_energy_ratio,
-    )
-    std_mid = std(
-        [m.spectral.mid_energy_ratio for m in all_metrics],
-        mean_metrics.spectral.mid_energy_ratio,
-    )
-    std_treble = std(
-        [m.spectral.treble_energy_ratio for m in all_metrics],
-        mean_metrics.spectral.treble_energy_ratio,
-    )
-
-    std_lufs = std(
-        [m.advanced.lufs_integrated for m in all_metrics],
-        mean_metrics.advanced.lufs_integrated,
-    )
-    std_transient = std(
-        [m.advanced.transient_density for m in all_metrics],
-        mean_metrics.advanced.transient_density,
-    )
-    std_attack = std(
-        [m.advanced.attack_time_ms for m in all_metrics],
-        mean_metrics.advanced.attack_time_ms,
-    )
-    std_decay = std(
-        [m.advanced.sustain_decay_rate_db_s for m in all_metrics],
-        mean_metrics.advanced.sustain_decay_rate_db_s,
-    )
 
-    from guitar_tone_shootout.metrics import (
-        AdvancedMetrics,
-        CoreMetrics,
-        SpectralMetrics,
-    )
+def _metrics_from_values(
+    values: NDArray[np.float64], duration_seconds: float, sample_rate: int
+) -> AudioMetrics:
+    """Build AudioMetrics from one row of values in _METRIC_FIELDS order."""
+    fields: dict[str, dict[str, Any]] = {"core": {}, "spectral": {}, "advanced": {}}
+    for (group, name), value in zip(_METRIC_FIELDS, values.tolist(), strict=True):
+        fields[group][name] = value
 
     return AudioMetrics(
-        duration_seconds=0.0,  # Not meaningful for std
-        sample_rate=all_metrics[0].sample_rate,
-        core=CoreMetrics(
-            rms_dbfs=std_rms,
-            peak_dbfs=std_peak,
-            crest_factor_db=std_crest,
-            dynamic_range_db=std_dynamic,
-        ),
-        spectral=SpectralMetrics(
-            spectral_centroid_hz=std_centroid,
-            bass_energy_ratio=std_bass,
-            mid_energy_ratio=std_mid,
-            treble_energy_ratio=std_treble,
-        ),
-        advanced=AdvancedMetrics(
-            lufs_integrated=std_lufs,
-            transient_density=std_transient,
-            attack_time_ms=std_attack,
-            sustain_decay_rate_db_s=std_decay,
-        ),
+        duration_seconds=duration_seconds,
+        sample_rate=sample_rate,
+        core=CoreMetrics(**fields["core"]),
+        spectral=SpectralMetrics(**fields["spectral"]),
+        advanced=AdvancedMetrics(**fields["advanced"]),
     )
 
 
@@ -792,14 +698,18 @@ def _get_metrics_cache_key(
     shootout_averages: AudioMetrics,
     amp_name: str | None,
 ) -> str:
-    """Generate a cache key for metrics combination."""
-    data = {
-        "segment": segment_metrics.model_dump_json(),
-        "averages": shootout_averages.model_dump_json(),
-        "amp_name": amp_name or "",
-    }
-    content = json.dumps(data, sort_keys=True)
-    return hashlib.sha256(content.encode()).hexdigest()
+    """Generate a cache key for metrics combination.
+
+    Hashes the packed float64 values of every field of both models rather
+    than their JSON serializations.
+    """
+    pair = (segment_metrics, shootout_averages)
+    values = np.column_stack(
+        (_metrics_matrix(pair), [(m.duration_seconds, m.sample_rate) for m in pair])
+    )
+    digest = hashlib.blake2b(values.tobytes(), digest_size=16)
+    digest.update((amp_name or "").encode())
+    return digest.hexdigest()
 
 
 def is_llm_evaluation_enabled() -> bool:
@@ -21,10 +21,11 @@ Example:
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 import numpy as np
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 if TYPE_CHECKING:
     from numpy.typing import NDArray
@@ -58,6 +59,8 @@ class CoreMetrics(BaseModel):
         dynamic_range_db: Difference between loudest and quietest parts
     """
 
+    model_config = ConfigDict(frozen=True)
+
     rms_dbfs: float = Field(..., description="RMS level in dBFS")
     peak_dbfs: float = Field(..., description="Peak level in dBFS")
     crest_factor_db: float = Field(..., description="Peak/RMS ratio in dB")
@@ -74,6 +77,8 @@ class SpectralMetrics(BaseModel):
         treble_energy_ratio: Proportion of energy in treble range (2000-20000 Hz)
     """
 
+    model_config = ConfigDict(frozen=True)
+
     spectral_centroid_hz: float = Field(
         ..., description="Spectral centroid in Hz (brightness)"
     )
@@ -98,6 +103,8 @@ class AdvancedMetrics(BaseModel):
         sustain_decay_rate_db_s: Rate of amplitude decay in dB/second
     """
 
+    model_config = ConfigDict(frozen=True)
+
     lufs_integrated: float = Field(..., description="Integrated loudness in LUFS")
     transient_density: float = Field(
         ..., ge=0.0, description="Transients per second"
@@ -124,6 +131,8 @@ class AudioMetrics(BaseModel):
         advanced: Advanced dynamics metrics
     """
 
+    model_config = ConfigDict(frozen=True)
+
     duration_seconds: float = Field(..., ge=0.0, description="Audio duration in seconds")
     sample_rate: int = Field(..., gt=0, description="Sample rate in Hz")
     core: CoreMetrics = Field(..., description="Core loudness metrics")
@@ -145,10 +154,7 @@ def calculate_rms_dbfs(audio: NDArray[np.floating]) -> float:
     Returns:
         RMS level in dB relative to full scale
     """
-    rms = np.sqrt(np.mean(audio.astype(np.float64) ** 2))
-    if rms == 0:
-        return float("-inf")
-    return float(20 * np.log10(rms))
+    return float(_rms_dbfs(audio))
 
 
 def calculate_peak_dbfs(audio: NDArray[np.floating]) -> float:
@@ -160,10 +166,7 @@ def calculate_peak_dbfs(audio: NDArray[np.floating]) -> float:
     Returns:
         Peak level in dB relative to full scale
     """
-    peak = np.max(np.abs(audio))
-    if peak == 0:
-        return float("-inf")
-    return float(20 * np.log10(peak))
+    return float(_peak_dbfs(audio))
 
 
 def calculate_crest_factor_db(
@@ -189,10 +192,30 @@ def calculate_crest_factor_db(
     if peak_dbfs is None:
         peak_dbfs = calculate_peak_dbfs(audio)
 
-    if np.isinf(rms_dbfs):
-        return 0.0
+    return float(_crest_factor_db(np.asarray(rms_dbfs), np.asarray(peak_dbfs)))
+
+
+def _rms_dbfs(audio: NDArray[np.floating]) -> NDArray[np.floating]:
+    """RMS level in dBFS along the last axis (-inf for silence)."""
+    samples = audio.astype(np.float64)
+    rms = np.sqrt(np.mean(samples * samples, axis=-1))
+    with np.errstate(divide="ignore"):
+        return np.asarray(20 * np.log10(rms))
+
+
+def _peak_dbfs(audio: NDArray[np.floating]) -> NDArray[np.floating]:
+    """Peak level in dBFS along the last axis (-inf for silence)."""
+    peak = np.max(np.abs(audio), axis=-1)
+    with np.errstate(divide="ignore"):
+        return np.asarray(20 * np.log10(peak))
+
 
-    return peak_dbfs - rms_dbfs
+def _crest_factor_db(
+    rms_dbfs: NDArray[np.floating], peak_dbfs: NDArray[np.floating]
+) -> NDArray[np.floating]:
+    """Crest factor in dB from RMS and peak levels (0 where the audio is silent)."""
+    with np.errstate(invalid="ignore"):
+        return np.where(np.isinf(rms_dbfs), 0.0, peak_dbfs - rms_dbfs)
 
 
 def calculate_dynamic_range_db(
@@ -273,6 +296,35 @@ def extract_core_metrics(
 # =============================================================================
 
 
+def _rfft(audio: NDArray[np.floating]) -> NDArray[np.complexfloating]:
+    """Single-precision real FFT along the last axis.
+
+    Uses scipy's multithreaded FFT when available, otherwise numpy's.
+
+    Args:
+        audio: Audio samples (1D array, or 2D with one segment per row)
+
+    Returns:
+        Complex spectrum of each row
+    """
+    samples = audio.astype(np.float32, copy=False)
+    try:
+        from scipy import fft as scipy_fft
+    except ImportError:
+        return np.fft.rfft(samples, axis=-1)
+
+    spectrum: NDArray[np.complexfloating] = scipy_fft.rfft(samples, axis=-1, workers=-1)
+    return spectrum
+
+
+@lru_cache(maxsize=32)
+def _rfft_freqs(n: int, sample_rate: int) -> NDArray[np.floating]:
+    """Read-only frequency in Hz of each rfft bin for n samples."""
+    freqs = np.fft.rfftfreq(n, 1.0 / sample_rate)
+    freqs.setflags(write=False)
+    return freqs
+
+
 def calculate_spectral_centroid_hz(
     audio: NDArray[np.floating],
     sample_rate: int,
@@ -289,13 +341,18 @@ def calculate_spectral_centroid_hz(
     Returns:
         Spectral centroid in Hz
     """
-    # Compute FFT
-    n = len(audio)
-    fft = np.fft.rfft(audio.astype(np.float64))
+    fft = _rfft(audio)
+    return _centroid_from_spectrum(fft, len(audio), sample_rate)
+
+
+def _centroid_from_spectrum(
+    fft: NDArray[np.complexfloating], n: int, sample_rate: int
+) -> float:
+    """Spectral centroid from the rfft of n samples."""
     magnitude = np.abs(fft)
 
     # Frequency bins
-    freqs = np.fft.rfftfreq(n, 1.0 / sample_rate)
+    freqs = _rfft_freqs(n, sample_rate)
 
     # Compute centroid as weighted average
     total_magnitude = np.sum(magnitude)
@@ -319,22 +376,19 @@ def calculate_band_energy_ratios(
     Returns:
         Tuple of (bass_ratio, mid_ratio, treble_ratio)
     """
-    # Compute FFT
-    n = len(audio)
-    fft = np.fft.rfft(audio.astype(np.float64))
-    power = np.abs(fft) ** 2
+    fft = _rfft(audio)
+    return _band_ratios_from_spectrum(fft, len(audio), sample_rate)
 
-    # Frequency bins
-    freqs = np.fft.rfftfreq(n, 1.0 / sample_rate)
 
-    # Calculate energy in each band
-    bass_mask = (freqs >= BASS_LOW) & (freqs < BASS_HIGH)
-    mid_mask = (freqs >= MID_LOW) & (freqs < MID_HIGH)
-    treble_mask = (freqs >= TREBLE_LOW) & (freqs <= min(TREBLE_HIGH, sample_rate / 2))
+def _band_ratios_from_spectrum(
+    fft: NDArray[np.complexfloating], n: int, sample_rate: int
+) -> tuple[float, float, float]:
+    """Bass, mid and treble energy ratios from the rfft of n samples."""
+    power = fft.real**2 + fft.imag**2
 
-    bass_energy = np.sum(power[bass_mask])
-    mid_energy = np.sum(power[mid_mask])
-    treble_energy = np.sum(power[treble_mask])
+    # Sum the power of every bin into its band in a single pass
+    band_energy = np.bincount(_band_indices(n, sample_rate), weights=power, minlength=4)
+    bass_energy, mid_energy, treble_energy = band_energy[:3]
 
     total_energy = bass_energy + mid_energy + treble_energy
 
@@ -348,6 +402,18 @@ def calculate_band_energy_ratios(
     )
 
 
+@lru_cache(maxsize=32)
+def _band_indices(n: int, sample_rate: int) -> NDArray[np.intp]:
+    """Band of each rfft bin for n samples: 0 bass, 1 mid, 2 treble, 3 outside."""
+    freqs = _rfft_freqs(n, sample_rate)
+    bands = np.full(freqs.shape, 3, dtype=np.intp)
+    bands[(freqs >= BASS_LOW) & (freqs < BASS_HIGH)] = 0
+    bands[(freqs >= MID_LOW) & (freqs < MID_HIGH)] = 1
+    bands[(freqs >= TREBLE_LOW) & (freqs <= min(TREBLE_HIGH, sample_rate / 2))] = 2
+    bands.setflags(write=False)
+    return bands
+
+
 def extract_spectral_metrics(
     audio: NDArray[np.floating],
     sample_rate: int,
@@ -361,8 +427,10 @@ def extract_spectral_metrics(
     Returns:
         SpectralMetrics model with all spectral metrics
     """
-    centroid = calculate_spectral_centroid_hz(audio, sample_rate)
-    bass, mid, treble = calculate_band_energy_ratios(audio, sample_rate)
+    # One FFT shared by the centroid and the band ratios
+    fft = _rfft(audio)
+    centroid = _centroid_from_spectrum(fft, len(audio), sample_rate)
+    bass, mid, treble = _band_ratios_from_spectrum(fft, len(audio), sample_rate)
 
     return SpectralMetrics(
         spectral_centroid_hz=centroid,
@@ -628,24 +696,26 @@ def calculate_sustain_decay_rate_db_s(
     # Use multiple measurement windows to get average decay rate
     measurement_window = max(2, int(sample_rate * window_ms / 1000))
 
-    decay_rates = []
-    for i in range(0, len(decay_region) - measurement_window, measurement_window):
-        start_amp = np.mean(decay_region[i : i + measurement_window // 2])
-        end_amp = np.mean(
-            decay_region[i + measurement_window // 2 : i + measurement_window]
-        )
-
-        if start_amp > 0 and end_amp > 0:
-            # Calculate dB change
-            db_change = 20 * np.log10(end_amp / start_amp)
-            # Time in seconds for this window
-            time_s = (measurement_window / 2) / sample_rate
-            if time_s > 0:
-                decay_rates.append(db_change / time_s)
+    # Split the decay region into whole windows and compare the mean
+    # amplitude of each window's first half against its second half
+    n_windows = len(range(0, len(decay_region) - measurement_window, measurement_window))
+    if n_windows == 0:
+        return 0.0
+    half = measurement_window // 2
+    windows = decay_region[: n_windows * measurement_window].reshape(
+        n_windows, measurement_window
+    )
+    start_amp = windows[:, :half].mean(axis=1)
+    end_amp = windows[:, half:].mean(axis=1)
 
-    if not decay_rates:
+    valid = (start_amp > 0) & (end_amp > 0)
+    if not np.any(valid):
         return 0.0
 
+    # dB change over the time between the two half-window centres
+    time_s = (measurement_window / 2) / sample_rate
+    decay_rates = 20 * np.log10(end_amp[valid] / start_amp[valid]) / time_s
+
     # Return median to be robust against outliers
     return float(np.median(decay_rates))
 
@@ -708,25 +778,75 @@ def extract_metrics(
     if audio.ndim > 1:
         audio = audio.flatten()
 
-    duration = len(audio) / sample_rate
+    return extract_metrics_batch(audio[np.newaxis, :], sample_rate)[0]
+
+
+def extract_metrics_batch(
+    segments: NDArray[np.floating],
+    sample_rate: int,
+) -> list[AudioMetrics]:
+    """Extract audio metrics for several equal-length segments at once.
+
+    RMS, peak, crest factor and the spectrum are computed for every
+    segment in one vectorized pass over the rows; the remaining metrics
+    are measured per segment.
+
+    Args:
+        segments: Audio samples as 2D array of shape (n_segments, n_samples)
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        One AudioMetrics model per segment, in row order
+
+    Raises:
+        ValueError: If segments is not a 2D array
+    """
+    if segments.ndim != 2:
+        raise ValueError(f"Expected 2D (n_segments, n_samples) array, got {segments.ndim}D")
+
+    n_segments, n_samples = segments.shape
+    duration = n_samples / sample_rate
 
     logger.debug(
-        f"Extracting metrics: {duration:.2f}s @ {sample_rate} Hz "
-        f"({len(audio)} samples)"
+        f"Extracting metrics: {n_segments} x {duration:.2f}s @ {sample_rate} Hz "
+        f"({n_samples} samples each)"
     )
 
-    # Extract all metric groups
-    core = extract_core_metrics(audio, sample_rate)
-    spectral = extract_spectral_metrics(audio, sample_rate)
-    advanced = extract_advanced_metrics(audio, sample_rate)
-
-    return AudioMetrics(
-        duration_seconds=duration,
-        sample_rate=sample_rate,
-        core=core,
-        spectral=spectral,
-        advanced=advanced,
-    )
+    # Level metrics for all segments at once (same helpers as the scalar functions)
+    rms_dbfs = _rms_dbfs(segments)
+    peak_dbfs = _peak_dbfs(segments)
+    crest_factor_db = _crest_factor_db(rms_dbfs, peak_dbfs)
+
+    # One FFT across every row, shared by the centroid and band ratios
+    spectra = _rfft(segments)
+
+    results = []
+    for i in range(n_segments):
+        audio = segments[i]
+        bass, mid, treble = _band_ratios_from_spectrum(spectra[i], n_samples, sample_rate)
+        results.append(
+            AudioMetrics(
+                duration_seconds=duration,
+                sample_rate=sample_rate,
+                core=CoreMetrics(
+                    rms_dbfs=float(rms_dbfs[i]),
+                    peak_dbfs=float(peak_dbfs[i]),
+                    crest_factor_db=float(crest_factor_db[i]),
+                    dynamic_range_db=calculate_dynamic_range_db(audio, sample_rate),
+                ),
+                spectral=SpectralMetrics(
+                    spectral_centroid_hz=_centroid_from_spectrum(
+                        spectra[i], n_samples, sample_rate
+                    ),
+                    bass_energy_ratio=bass,
+                    mid_energy_ratio=mid,
+                    treble_energy_ratio=treble,
+                ),
+                advanced=extract_advanced_metrics(audio, sample_rate),
+            )
+        )
+
+    return results
 
 
 def compare_metrics(
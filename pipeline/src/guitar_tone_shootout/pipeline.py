@@ -1,32 +1,101 @@
 """Main processing pipeline for Guitar Tone Shootout."""
 
+from __future__ import annotations
+
+import hashlib
+import json
 import logging
+import os
+import re
+import shutil
 import subprocess
 import tempfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass
+from functools import lru_cache
 from pathlib import Path
+from threading import Thread
+from typing import IO, TYPE_CHECKING, Literal
+
+from pedalboard.io import AudioFile
 
+from guitar_tone_shootout import card
 from guitar_tone_shootout.audio import (
     AudioProcessingError,
     load_audio,
     process_chain,
     save_audio,
+    trim_silence_array,
 )
-from guitar_tone_shootout.config import Comparison, DITrack, SignalChain
+from guitar_tone_shootout.card import CardContent, render_card
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    import numpy as np
+    from jinja2 import Template
+    from numpy.typing import NDArray
+    from playwright.sync_api import Browser
+
+    from guitar_tone_shootout.config import Comparison, DITrack, SignalChain
 
 logger = logging.getLogger(__name__)
 
+# Thread count for a single FFmpeg process (decoders, filter graphs and the
+# x264 encoder); clips encoded concurrently share it, see _clip_ffmpeg_threads.
+# -filter_threads/-filter_complex_threads assume FFmpeg >= 6.0.
+FFMPEG_THREADS = os.cpu_count() or 1
+
+# Trailing FFmpeg stderr lines kept for error messages
+FFMPEG_STDERR_LINES = 200
+
+# Worker threads per pipeline stage (Pedalboard and FFmpeg both release the GIL)
+SEGMENT_WORKERS = min(4, os.cpu_count() or 1)
+
+# Segment image renderers: in-process Pillow card, or HTML template via Playwright
+ImageRenderer = Literal["pillow", "html"]
+
+# Overrides the segment image cache directory; set it empty to disable the cache
+IMAGE_CACHE_ENV = "GUITAR_TONE_SHOOTOUT_IMAGE_CACHE"
+
+# Most recently used images kept in the cache; older ones are evicted
+IMAGE_CACHE_MAX_ENTRIES = 256
+
+
+def _default_image_cache_dir() -> Path | None:
+    """Image cache directory from the environment (None when disabled)."""
+    override = os.environ.get(IMAGE_CACHE_ENV)
+    if override is not None:
+        return Path(override) if override else None
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "guitar-tone-shootout" / "images"
+
+
+# Rendered segment images, keyed by a hash of the rendered content
+IMAGE_CACHE_DIR = _default_image_cache_dir()
+
 
 class PipelineError(Exception):
     """Error during pipeline processing."""
 
 
-def process_comparison(comparison: Comparison, duration: float | None = None) -> Path:
+def process_comparison(
+    comparison: Comparison,
+    duration: float | None = None,
+    renderer: ImageRenderer = "pillow",
+    image_cache: Path | bool = True,
+) -> Path:
     """
     Process a complete comparison and generate outputs.
 
     Args:
         comparison: Validated Comparison configuration
         duration: Optional duration in seconds to trim DI tracks to
+        renderer: Segment image renderer ("pillow", or "html" for the Playwright template)
+        image_cache: Segment image cache directory; True uses IMAGE_CACHE_DIR,
+            False disables the cache
 
     Returns:
         Path to the generated video file
@@ -50,66 +119,159 @@ def process_comparison(comparison: Comparison, duration: float | None = None) ->
     for dir_path in [output_dir, clips_dir, audio_dir, images_dir]:
         dir_path.mkdir(parents=True, exist_ok=True)
 
-    clip_paths: list[Path] = []
-    audio_paths: list[Path] = []
+    segments = comparison.get_segments()
+
+    # Up to SEGMENT_WORKERS clips encode at once, so split the cores between them
+    clip_threads = _clip_ffmpeg_threads()
+
+    # Stages run as a pipeline: audio for later segments is processed and
+    # earlier clips are encoded while the current image renders. Images stay
+    # on this thread because the Playwright sync API is bound to it.
+    with (
+        _browser_session() if renderer == "html" else nullcontext() as browser,
+        ThreadPoolExecutor(max_workers=SEGMENT_WORKERS) as audio_pool,
+        ThreadPoolExecutor(max_workers=SEGMENT_WORKERS) as clip_pool,
+    ):
+        # Steps 1-2: Trim DI tracks and process through signal chains. At most
+        # SEGMENT_WORKERS segments are in flight, so peak memory holds a bounded
+        # number of decoded takes however long the comparison is.
+        pending_audio: deque[Future[tuple[Path, NDArray[np.float32], int]]] = deque()
+        pending_clips: deque[Future[Path]] = deque()
+
+        def submit_audio(index: int) -> None:
+            di_track, signal_chain = segments[index]
+            pending_audio.append(
+                audio_pool.submit(
+                    _process_segment_audio,
+                    di_track=di_track,
+                    signal_chain=signal_chain,
+                    output_path=audio_dir / f"{safe_name}_{index:03d}.flac",
+                    project_root=project_root,
+                    duration=duration,
+                )
+            )
+
+        try:
+            for index in range(min(SEGMENT_WORKERS, len(segments))):
+                submit_audio(index)
+
+            audio_paths: list[Path] = []
+            clip_paths: list[Path] = []
+
+            for i, (di_track, signal_chain) in enumerate(segments):
+                logger.info(f"Processing segment {i + 1}/{comparison.segment_count}")
+                logger.info(f"  DI: {di_track.file.name} ({di_track.guitar}, {di_track.pickup})")
+                logger.info(f"  Chain: {signal_chain.name}")
+
+                # Step 3: Generate image for this segment
+                image = generate_image(
+                    comparison=comparison,
+                    di_track=di_track,
+                    signal_chain=signal_chain,
+                    output_path=images_dir / f"{safe_name}_{i:03d}.jpg",
+                    browser=browser,
+                    renderer=renderer,
+                    image_cache=image_cache,
+                )
+
+                # Popping drops the future, so only the clip encode keeps the samples
+                audio_path, samples, sample_rate = pending_audio.popleft().result()
+                audio_paths.append(audio_path)
+                if i + SEGMENT_WORKERS < len(segments):
+                    submit_audio(i + SEGMENT_WORKERS)
+
+                # Queued encodes hold their samples too, so wait for the oldest first
+                if len(pending_clips) >= SEGMENT_WORKERS:
+                    clip_paths.append(pending_clips.popleft().result())
+
+                # Step 4: Create video clip from image + audio (samples piped, no FLAC decode)
+                pending_clips.append(
+                    clip_pool.submit(
+                        create_clip,
+                        image=image,
+                        audio=samples,
+                        output_path=clips_dir / f"{safe_name}_{i:03d}.mp4",
+                        sample_rate=sample_rate,
+                        threads=clip_threads,
+                    )
+                )
+                del samples
+
+            # Step 5: Create combined FLAC audio file (all audio is done, so this
+            # runs while the last clips are still encoding)
+            combined_audio_future = audio_pool.submit(
+                concatenate_audio,
+                audio_files=audio_paths,
+                output_path=audio_dir / f"{safe_name}_full.flac",
+            )
+
+            clip_paths.extend(future.result() for future in pending_clips)
+
+            # Step 6: Concatenate all clips into master video (main output in root folder)
+            master_video = concatenate_clips(
+                clips=clip_paths,
+                output_path=output_dir / f"{safe_name}.mp4",
+            )
+            combined_audio = combined_audio_future.result()
+
+        except BaseException:
+            # Fail fast: drop queued segments instead of waiting for them on exit
+            audio_pool.shutdown(cancel_futures=True)
+            clip_pool.shutdown(cancel_futures=True)
+            raise
 
-    for i, (di_track, signal_chain) in enumerate(comparison.get_segments()):
-        logger.info(f"Processing segment {i + 1}/{comparison.segment_count}")
-        logger.info(f"  DI: {di_track.file.name} ({di_track.guitar}, {di_track.pickup})")
-        logger.info(f"  Chain: {signal_chain.name}")
+    logger.info(f"Video: {master_video}")
+    logger.info(f"Audio: {combined_audio}")
 
-        # Step 1: Trim DI track (to duration if specified, otherwise just silence)
-        if duration is not None:
-            trimmed_di = trim_to_duration(di_track.file, duration)
-        else:
-            trimmed_di = trim_silence(di_track.file)
-
-        # Step 2: Process audio through signal chain
-        processed_audio = process_signal_chain(
-            di_track=trimmed_di,
-            signal_chain=signal_chain,
-            output_path=audio_dir / f"{safe_name}_{i:03d}.flac",
-            project_root=project_root,
-        )
-        audio_paths.append(processed_audio)
-
-        # Step 3: Generate image for this segment
-        image = generate_image(
-            comparison=comparison,
-            di_track=di_track,
-            signal_chain=signal_chain,
-            output_path=images_dir / f"{safe_name}_{i:03d}.png",
-        )
+    return master_video
 
-        # Step 4: Create video clip from image + audio
-        clip = create_clip(
-            image=image,
-            audio=processed_audio,
-            output_path=clips_dir / f"{safe_name}_{i:03d}.mp4",
-        )
-        clip_paths.append(clip)
 
-    # Step 5: Concatenate all clips into master video (main output in root folder)
-    master_video = concatenate_clips(
-        clips=clip_paths,
-        output_path=output_dir / f"{safe_name}.mp4",
-    )
+def _process_segment_audio(
+    di_track: DITrack,
+    signal_chain: SignalChain,
+    output_path: Path,
+    project_root: Path,
+    duration: float | None,
+) -> tuple[Path, NDArray[np.float32], int]:
+    """
+    Trim a DI track, process it through a signal chain and save the result.
 
-    # Step 6: Create combined FLAC audio file
-    combined_audio = concatenate_audio(
-        audio_files=audio_paths,
-        output_path=audio_dir / f"{safe_name}_full.flac",
+    Args:
+        di_track: DI track to process
+        signal_chain: SignalChain with ordered effects
+        output_path: Path for output FLAC file
+        project_root: Project root directory for resolving input paths
+        duration: Optional duration in seconds to trim to (silence is trimmed otherwise)
+
+    Returns:
+        Tuple of (processed audio path, processed samples, sample rate)
+    """
+    # Trim DI track to duration if specified, otherwise strip silence (both in memory)
+    processed, sample_rate = _apply_signal_chain(
+        di_track.file,
+        signal_chain,
+        project_root,
+        strip_silence=duration is None,
+        duration=duration,
     )
 
-    logger.info(f"Video: {master_video}")
-    logger.info(f"Audio: {combined_audio}")
+    # The FLAC is kept for the combined audio; clips are encoded from the samples
+    try:
+        save_audio(processed, output_path, sample_rate)
+    except AudioProcessingError as e:
+        raise PipelineError(f"Audio processing failed: {e}") from e
 
-    return master_video
+    return output_path, processed, sample_rate
 
 
 def trim_silence(audio_path: Path, threshold_db: float = -50.0) -> Path:
     """
-    Trim leading and trailing silence from an audio file using FFmpeg.
+    Trim leading and trailing silence from an audio file.
+
+    Scans the samples in memory (see trim_silence_array) rather than running
+    FFmpeg's silenceremove/areverse/silenceremove/areverse graph, which
+    decodes the file and buffers it in full for each reverse. Silence inside
+    the take is kept; all channels are preserved.
 
     Args:
         audio_path: Path to input audio file
@@ -125,37 +287,24 @@ def trim_silence(audio_path: Path, threshold_db: float = -50.0) -> Path:
 
     # Create temp file for output
     suffix = audio_path.suffix
-    _temp_fd, temp_path = tempfile.mkstemp(suffix=suffix)
+    temp_fd, temp_path = tempfile.mkstemp(suffix=suffix)
+    os.close(temp_fd)
 
     try:
-        # FFmpeg silenceremove filter:
-        # - Remove silence from start (start_periods=1)
-        # - Reverse, remove silence from start again (removes end silence)
-        # - Reverse back to original direction
-        filter_complex = (
-            f"silenceremove=start_periods=1:start_silence=0.05"
-            f":start_threshold={threshold_db}dB,"
-            f"areverse,"
-            f"silenceremove=start_periods=1:start_silence=0.05"
-            f":start_threshold={threshold_db}dB,"
-            f"areverse"
-        )
+        with AudioFile(str(audio_path)) as f:
+            audio = f.read(f.frames)
+            sample_rate = f.samplerate
 
-        _run_ffmpeg(
-            [
-                "-i",
-                str(audio_path),
-                "-af",
-                filter_complex,
-                str(temp_path),
-            ]
-        )
+        trimmed = trim_silence_array(audio, int(sample_rate), threshold_db)
+
+        with AudioFile(temp_path, "w", sample_rate, trimmed.shape[0]) as out:
+            out.write(trimmed)
 
         return Path(temp_path)
 
-    except subprocess.CalledProcessError as e:
+    except Exception as e:
         Path(temp_path).unlink(missing_ok=True)
-        raise PipelineError(f"Failed to trim silence: {e.stderr}") from e
+        raise PipelineError(f"Failed to trim silence: {e}") from e
 
 
 def trim_to_duration(audio_path: Path, duration: float) -> Path:
@@ -216,19 +365,50 @@ def process_signal_chain(
     Returns:
         Path to processed audio file
     """
+    processed, sample_rate = _apply_signal_chain(di_track, signal_chain, project_root)
+
+    try:
+        save_audio(processed, output_path, sample_rate)
+        return output_path
+
+    except AudioProcessingError as e:
+        raise PipelineError(f"Audio processing failed: {e}") from e
+
+
+def _apply_signal_chain(
+    di_track: Path,
+    signal_chain: SignalChain,
+    project_root: Path,
+    strip_silence: bool = False,
+    duration: float | None = None,
+) -> tuple[NDArray[np.float32], int]:
+    """
+    Load a DI track and run it through a signal chain in memory.
+
+    Args:
+        di_track: Path to DI audio file
+        signal_chain: SignalChain with ordered effects
+        project_root: Project root directory for resolving input paths
+        strip_silence: Trim leading/trailing silence from the DI after loading
+        duration: Optional duration in seconds to trim the DI to after loading
+
+    Returns:
+        Tuple of (processed audio, sample rate)
+    """
     logger.debug(f"Processing signal chain '{signal_chain.name}' on: {di_track.name}")
 
     try:
         # Load audio
         audio, sample_rate = load_audio(di_track)
 
-        # Process through chain
-        processed = process_chain(audio, sample_rate, signal_chain.chain, project_root)
+        if duration is not None:
+            audio = audio[..., : int(duration * sample_rate)]
 
-        # Save output
-        save_audio(processed, output_path, sample_rate)
+        if strip_silence:
+            audio = trim_silence_array(audio, sample_rate)
 
-        return output_path
+        # Process through chain
+        return process_chain(audio, sample_rate, signal_chain.chain, project_root), sample_rate
 
     except AudioProcessingError as e:
         raise PipelineError(f"Audio processing failed: {e}") from e
@@ -239,70 +419,151 @@ def generate_image(
     di_track: DITrack,
     signal_chain: SignalChain,
     output_path: Path,
+    *,
+    browser: Browser | None = None,
+    renderer: ImageRenderer = "pillow",
+    image_cache: Path | bool = True,
 ) -> Path:
     """
     Generate comparison image showing signal chain info.
 
-    Uses Playwright to render HTML template to PNG.
+    Draws the card directly with Pillow, or renders the HTML template with
+    Playwright when renderer is "html" (honours custom templates). Output is
+    PNG, or JPEG for a .jpg path. Renders are cached by content and copied
+    into place on a hit.
 
     Args:
         comparison: Comparison configuration
         di_track: DI track with metadata
         signal_chain: Signal chain with effects
-        output_path: Path for output PNG file
+        output_path: Path for output image (.png or .jpg)
+        browser: Running browser to reuse for the HTML renderer (launched if None)
+        renderer: "pillow" or "html"
+        image_cache: Cache directory; True uses IMAGE_CACHE_DIR, False disables the cache
 
     Returns:
         Path to generated image
     """
-    from jinja2 import Environment, FileSystemLoader
-
     logger.debug(f"Generating image: {output_path}")
 
-    # Template directory (relative to project root)
-    template_dir = comparison.project_root / "templates"
-    if not template_dir.exists():
-        template_dir.mkdir(parents=True)
-        # Create default template if none exists
-        _create_default_template(template_dir)
-
-    # Render HTML from template
-    env = Environment(loader=FileSystemLoader(str(template_dir)))
-
-    try:
-        template = env.get_template("comparison.html")
-    except Exception:
-        _create_default_template(template_dir)
-        template = env.get_template("comparison.html")
+    if image_cache is True:
+        cache_dir = IMAGE_CACHE_DIR
+    elif image_cache is False:
+        cache_dir = None
+    else:
+        cache_dir = image_cache
 
     # Extract NAM model and IR info from signal chain
     amp_name, amp_source = _extract_effect_info(signal_chain, "nam")
     cab_name, cab_source = _extract_effect_info(signal_chain, "ir")
 
-    html_content = template.render(
+    content = CardContent(
         comparison_name=comparison.meta.name,
-        guitar=di_track.guitar,
-        pickup=di_track.pickup,
         signal_chain_name=signal_chain.name,
         signal_chain_description=signal_chain.description,
+        guitar=di_track.guitar,
+        pickup=di_track.pickup,
         amp_name=amp_name,
         amp_source=amp_source,
         cab_name=cab_name,
         cab_source=cab_source,
         author=comparison.meta.author,
-        effects=signal_chain.chain,
     )
 
-    # Write HTML to temp file
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".html", delete=False) as temp_html:
-        temp_html.write(html_content)
-        temp_html_path = Path(temp_html.name)
+    if renderer == "html":
+        # Template directory (relative to project root)
+        template = _get_template(comparison.project_root / "templates")
+        html_content = template.render(**asdict(content), effects=signal_chain.chain)
+        cache_source = html_content
+    else:
+        # Any change to the card renderer's code invalidates its cached images
+        cache_source = f"pillow-{_card_renderer_digest()}:{content!r}"
+
+    # Identical content renders to an identical image, so reuse earlier renders
+    cached_image = None
+    if cache_dir is not None:
+        cache_key = hashlib.blake2b(cache_source.encode("utf-8"), digest_size=16).hexdigest()
+        cached_image = cache_dir / f"{cache_key}{output_path.suffix}"
+        if cached_image.exists():
+            logger.debug(f"Using cached image: {cached_image}")
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(cached_image, output_path)
+            # Refresh the modification time so eviction keeps recently used images
+            cached_image.touch()
+            return output_path
+
+    # Replace rather than overwrite: outputs of older runs may be hardlinks into the cache
+    output_path.unlink(missing_ok=True)
+
+    if renderer == "html":
+        # Write HTML to temp file
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".html", delete=False) as temp_html:
+            temp_html.write(html_content)
+            temp_html_path = Path(temp_html.name)
+
+        try:
+            # Use Playwright to screenshot HTML
+            _render_html_to_png(temp_html_path, output_path, browser)
+        finally:
+            temp_html_path.unlink(missing_ok=True)
+    else:
+        render_card(content, output_path)
+
+    if cached_image is not None:
+        try:
+            cached_image.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(output_path, cached_image)
+            _evict_cached_images(cached_image.parent)
+        except OSError as e:
+            logger.debug(f"Could not cache image {output_path}: {e}")
+
+    return output_path
+
+
+@lru_cache(maxsize=1)
+def _card_renderer_digest() -> str:
+    """Hash of the Pillow card renderer's source, used to key its cached images."""
+    source = Path(card.__file__).read_bytes()
+    return hashlib.blake2b(source, digest_size=8).hexdigest()
+
+
+def _evict_cached_images(cache_dir: Path, max_entries: int = IMAGE_CACHE_MAX_ENTRIES) -> None:
+    """Delete the least recently used images beyond max_entries from the cache."""
+    images = sorted(
+        (entry for entry in os.scandir(cache_dir) if entry.is_file()),
+        key=lambda entry: entry.stat().st_mtime_ns,
+        reverse=True,
+    )
+    for entry in images[max_entries:]:
+        Path(entry.path).unlink(missing_ok=True)
+
+
+@lru_cache(maxsize=4)
+def _get_template(template_dir: Path) -> Template:
+    """
+    Load the comparison template, compiling it once per template directory.
+
+    Args:
+        template_dir: Directory containing comparison.html (created with a default if missing)
+
+    Returns:
+        Compiled Jinja2 template
+    """
+    from jinja2 import Environment, FileSystemLoader
+
+    if not template_dir.exists():
+        template_dir.mkdir(parents=True)
+        # Create default template if none exists
+        _create_default_template(template_dir)
+
+    # Templates don't change during a run, so skip the per-render mtime check
+    env = Environment(loader=FileSystemLoader(str(template_dir)), auto_reload=False)
 
     try:
-        # Use Playwright to screenshot HTML
-        _render_html_to_png(temp_html_path, output_path)
-        return output_path
-    finally:
-        temp_html_path.unlink(missing_ok=True)
+        return env.get_template("comparison.html")
+    except Exception:
+        _create_default_template(template_dir)
+        return env.get_template("comparison.html")
 
 
 def _create_default_template(template_dir: Path) -> None:
@@ -445,24 +706,56 @@ def _create_default_template(template_dir: Path) -> None:
     logger.info(f"Created default template: {template_path}")
 
 
-def _render_html_to_png(html_path: Path, output_path: Path) -> None:
-    """Render HTML file to PNG using Playwright."""
-    from playwright.sync_api import sync_playwright
+# Fixed capture area matching the template's 1920x1080 body
+_SCREENSHOT_CLIP = {"x": 0, "y": 0, "width": 1920, "height": 1080}
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+@contextmanager
+def _browser_session() -> Iterator[Browser]:
+    """Launch a headless Chromium instance that can render many images."""
+    from playwright.sync_api import sync_playwright
 
     with sync_playwright() as p:
         browser = p.chromium.launch()
-        page = browser.new_page(viewport={"width": 1920, "height": 1080})
+        try:
+            yield browser
+        finally:
+            browser.close()
+
+
+def _render_html_to_png(html_path: Path, output_path: Path, browser: Browser | None = None) -> None:
+    """
+    Render HTML file to an image using Playwright, in a fresh page of the given browser.
+
+    A .jpg/.jpeg output path is encoded as JPEG, which Chromium encodes several
+    times faster than PNG. The image is only an intermediate for the H.264 clip.
+    """
+    if browser is None:
+        with _browser_session() as session:
+            _render_html_to_png(html_path, output_path, session)
+        return
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    page = browser.new_page(viewport={"width": 1920, "height": 1080})
+    try:
         page.goto(f"file://{html_path.absolute()}")
-        page.screenshot(path=str(output_path), full_page=False)
-        browser.close()
+        if output_path.suffix.lower() in {".jpg", ".jpeg"}:
+            page.screenshot(path=str(output_path), type="jpeg", quality=90, clip=_SCREENSHOT_CLIP)
+        else:
+            page.screenshot(path=str(output_path), clip=_SCREENSHOT_CLIP)
+    finally:
+        page.close()
 
 
 def create_clip(
     image: Path,
-    audio: Path,
+    audio: Path | NDArray[np.float32],
     output_path: Path,
+    sample_rate: int | None = None,
+    *,
+    video_codec: str = "libx264",
+    threads: int | None = None,
 ) -> Path:
     """
     Create video clip from static image and audio using FFmpeg.
@@ -471,16 +764,41 @@ def create_clip(
 
     Args:
         image: Path to image file
-        audio: Path to audio file
+        audio: Path to audio file, or samples (1D or (channels, samples)) piped as raw PCM
         output_path: Path for output MP4 file
+        sample_rate: Sample rate of the samples (required when audio is an array)
+        video_codec: H.264 encoder, libx264 or a hardware encoder such as h264_nvenc,
+            h264_qsv or h264_amf (clips to be concatenated must share one encoder)
+        threads: FFmpeg thread count (FFMPEG_THREADS if None); lower it when
+            encoding several clips at once
 
     Returns:
         Path to video clip
     """
     if not image.exists():
         raise PipelineError(f"Image not found: {image}")
-    if not audio.exists():
-        raise PipelineError(f"Audio not found: {audio}")
+
+    pcm: bytes | None = None
+    if isinstance(audio, Path):
+        duration = _probe_audio(audio).duration
+        audio_input = ["-i", str(audio)]
+    else:
+        if sample_rate is None:
+            raise PipelineError("sample_rate is required when audio is an array")
+        channels = 1 if audio.ndim == 1 else audio.shape[0]
+        duration = audio.shape[-1] / sample_rate
+        # FFmpeg expects interleaved little-endian float32 frames
+        pcm = audio.T.astype("<f4").tobytes()
+        audio_input = [
+            "-f",
+            "f32le",
+            "-ar",
+            str(sample_rate),
+            "-ac",
+            str(channels),
+            "-i",
+            "pipe:0",
+        ]
 
     logger.debug(f"Creating clip: {output_path}")
 
@@ -493,25 +811,23 @@ def create_clip(
                 "1",
                 "-i",
                 str(image),
-                "-i",
-                str(audio),
-                "-c:v",
-                "libx264",
-                "-tune",
-                "stillimage",
+                *audio_input,
+                *_video_codec_args(video_codec, threads),
                 "-c:a",
                 "aac",
                 "-b:a",
                 "384k",
                 "-ar",
                 "48000",
-                "-shortest",
-                "-pix_fmt",
-                "yuv420p",
+                # Explicit length; -shortest overshoots by the AAC/x264 buffering
+                "-t",
+                f"{duration:.6f}",
                 "-r",
                 "30",
                 str(output_path),
-            ]
+            ],
+            input_data=pcm,
+            threads=threads,
         )
 
         return output_path
@@ -520,6 +836,33 @@ def create_clip(
         raise PipelineError(f"Failed to create clip: {e.stderr}") from e
 
 
+def _clip_ffmpeg_threads() -> int:
+    """FFmpeg threads per clip when SEGMENT_WORKERS clips encode concurrently."""
+    return max(1, FFMPEG_THREADS // SEGMENT_WORKERS)
+
+
+def _video_codec_args(video_codec: str, threads: int | None = None) -> list[str]:
+    """FFmpeg output arguments for the clip video encoder (FFMPEG_THREADS if threads is None)."""
+    if threads is None:
+        threads = FFMPEG_THREADS
+    if video_codec == "libx264":
+        return [
+            "-c:v",
+            "libx264",
+            "-tune",
+            "stillimage",
+            "-threads",
+            str(threads),
+            "-x264-params",
+            f"threads={threads}:sliced-threads=1:lookahead-threads={min(2, threads)}",
+            "-pix_fmt",
+            "yuv420p",
+        ]
+    # Hardware encoders upload system-memory frames themselves; QSV takes NV12
+    pix_fmt = "nv12" if video_codec.endswith("_qsv") else "yuv420p"
+    return ["-c:v", video_codec, "-pix_fmt", pix_fmt]
+
+
 def concatenate_clips(
     clips: list[Path],
     output_path: Path,
@@ -545,13 +888,7 @@ def concatenate_clips(
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Create concat file list
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as concat_file:
-        for clip in clips:
-            # Escape single quotes in paths
-            escaped_path = str(clip.absolute()).replace("'", "'\\''")
-            concat_file.write(f"file '{escaped_path}'\n")
-        concat_path = Path(concat_file.name)
+    concat_path = _write_concat_list(clips, output_path.parent)
 
     try:
         _run_ffmpeg(
@@ -601,12 +938,7 @@ def concatenate_audio(
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Create concat file list
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as concat_file:
-        for audio in audio_files:
-            escaped_path = str(audio.absolute()).replace("'", "'\\''")
-            concat_file.write(f"file '{escaped_path}'\n")
-        concat_path = Path(concat_file.name)
+    concat_path = _write_concat_list(audio_files, output_path.parent)
 
     try:
         _run_ffmpeg(
@@ -617,8 +949,12 @@ def concatenate_audio(
                 "0",
                 "-i",
                 str(concat_path),
+                # Stream copy is not safe: FLAC STREAMINFO would keep the first
+                # file's sample count. Re-encode at the fastest (still lossless) level.
                 "-c:a",
                 "flac",
+                "-compression_level",
+                "0",
                 str(output_path),
             ]
         )
@@ -631,6 +967,116 @@ def concatenate_audio(
         concat_path.unlink(missing_ok=True)
 
 
+@dataclass(frozen=True)
+class _AudioInfo:
+    """Stream properties read from an audio file header."""
+
+    duration: float
+    sample_rate: int
+    channels: int
+
+
+def _probe_audio(path: Path) -> _AudioInfo:
+    """
+    Read duration, sample rate and channel count of an audio file.
+
+    Only the header is parsed, and results are cached per file version
+    (path, mtime and size), so repeated lookups cost a single stat.
+
+    Args:
+        path: Path to the audio file
+
+    Returns:
+        Audio stream properties
+
+    Raises:
+        PipelineError: If the file is missing or cannot be read
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError as e:
+        raise PipelineError(f"Audio not found: {path}") from e
+    return _probe_audio_cached(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=512)
+def _probe_audio_cached(path: str, mtime_ns: int, size: int) -> _AudioInfo:  # noqa: ARG001
+    """Header lookup behind _probe_audio (mtime and size only key the cache)."""
+    try:
+        with AudioFile(path) as f:
+            return _AudioInfo(
+                duration=f.frames / f.samplerate,
+                sample_rate=int(f.samplerate),
+                channels=f.num_channels,
+            )
+    except Exception as e:
+        # Containers pedalboard can't decode (m4a/aac, opus, ...) still work with FFmpeg
+        logger.debug(f"AudioFile could not open {path}, probing with ffprobe: {e}")
+        return _ffprobe_audio(path)
+
+
+def _ffprobe_audio(path: str) -> _AudioInfo:
+    """
+    Read duration, sample rate and channel count of the first audio stream with ffprobe.
+
+    Args:
+        path: Path to the audio file
+
+    Returns:
+        Audio stream properties
+
+    Raises:
+        PipelineError: If ffprobe is unavailable or finds no audio stream
+    """
+    cmd = [
+        "ffprobe",
+        "-v",
+        "error",
+        "-select_streams",
+        "a:0",
+        "-show_entries",
+        "stream=sample_rate,channels:format=duration",
+        "-of",
+        "json",
+        path,
+    ]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        probe = json.loads(result.stdout)
+        stream = probe["streams"][0]
+        return _AudioInfo(
+            duration=float(probe["format"]["duration"]),
+            sample_rate=int(stream["sample_rate"]),
+            channels=int(stream["channels"]),
+        )
+    except subprocess.CalledProcessError as e:
+        raise PipelineError(f"Failed to read audio file {path}: {e.stderr.strip()}") from e
+    except (OSError, ValueError, LookupError) as e:
+        raise PipelineError(f"Failed to read audio file {path}: {e}") from e
+
+
+def _write_concat_list(paths: list[Path], directory: Path) -> Path:
+    """
+    Write an FFmpeg concat demuxer file list.
+
+    Args:
+        paths: Files to concatenate, in order
+        directory: Where to create the list (the output directory, so it sits
+            on the same filesystem as the files FFmpeg writes)
+
+    Returns:
+        Path to the list file (caller deletes it)
+    """
+    with tempfile.NamedTemporaryFile(
+        mode="w", suffix=".txt", prefix=".concat_", dir=directory, delete=False
+    ) as concat_file:
+        for path in paths:
+            # Escape single quotes in paths
+            escaped_path = str(path.absolute()).replace("'", "'\\''")
+            concat_file.write(f"file '{escaped_path}'\n")
+        return Path(concat_file.name)
+
+
 def _extract_effect_info(signal_chain: SignalChain, effect_type: str) -> tuple[str, str]:
     """
     Extract display name and source from a signal chain effect.
@@ -642,10 +1088,19 @@ def _extract_effect_info(signal_chain: SignalChain, effect_type: str) -> tuple[s
     Returns:
         Tuple of (display_name, source) - e.g., ("JCM800 capture 3", "Tone3000")
     """
-    for effect in signal_chain.chain:
-        if effect.effect_type == effect_type:
+    effects = tuple((effect.effect_type, effect.value) for effect in signal_chain.chain)
+    return _extract_effect_info_cached(effects, effect_type)
+
+
+@lru_cache(maxsize=256)
+def _extract_effect_info_cached(
+    effects: tuple[tuple[str, str], ...], effect_type: str
+) -> tuple[str, str]:
+    """Memoized body of _extract_effect_info, keyed on (effect_type, value) pairs."""
+    for current_type, value in effects:
+        if current_type == effect_type:
             # Parse path like "tone3000/jcm800-44269/JCM800 capture 3.nam"
-            path_parts = effect.value.split("/")
+            path_parts = value.split("/")
 
             # Extract name from filename (remove extension)
             filename = path_parts[-1]
@@ -659,18 +1114,89 @@ def _extract_effect_info(signal_chain: SignalChain, effect_type: str) -> tuple[s
     return "None", ""
 
 
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w-]+")
+_REPEATED_UNDERSCORES = re.compile(r"_{2,}")
+
+
+@lru_cache(maxsize=256)
 def _sanitize_filename(name: str) -> str:
     """Convert a name to a safe filename."""
-    # Replace spaces with underscores, remove special chars
-    safe = "".join(c if c.isalnum() or c in "-_" else "_" for c in name)
+    # Replace spaces and special chars with underscores
+    safe = _UNSAFE_FILENAME_CHARS.sub("_", name)
     # Collapse multiple underscores
-    while "__" in safe:
-        safe = safe.replace("__", "_")
+    safe = _REPEATED_UNDERSCORES.sub("_", safe)
     return safe.strip("_").lower()
 
 
-def _run_ffmpeg(args: list[str]) -> subprocess.CompletedProcess[str]:
-    """Run FFmpeg with given arguments."""
+def _run_ffmpeg(
+    args: list[str],
+    threading: bool = True,
+    input_data: bytes | None = None,
+    threads: int | None = None,
+) -> subprocess.CompletedProcess[str]:
+    """
+    Run FFmpeg with given arguments.
+
+    Args:
+        args: FFmpeg input/filter/output arguments
+        threading: Set decoder and filter thread counts (placed before the first input)
+        input_data: Raw bytes written to FFmpeg's stdin (for "pipe:0" inputs)
+        threads: Thread count when threading (FFMPEG_THREADS, all cores, if None)
+
+    Returns:
+        Completed FFmpeg process (stdout is discarded, stderr holds the last lines)
+
+    Raises:
+        subprocess.CalledProcessError: If FFmpeg exits non-zero
+    """
+    if threading:
+        thread_count = str(FFMPEG_THREADS if threads is None else threads)
+        thread_args = [
+            "-threads",
+            thread_count,
+            "-filter_threads",
+            thread_count,
+            "-filter_complex_threads",
+            thread_count,
+        ]
+        args = [*thread_args, *args]
     cmd = ["ffmpeg", "-y", "-hide_banner", "-loglevel", "warning", *args]
     logger.debug(f"Running: {' '.join(cmd)}")
-    return subprocess.run(cmd, check=True, capture_output=True, text=True)
+
+    proc = subprocess.Popen(
+        cmd,
+        stdin=subprocess.PIPE if input_data is not None else subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+
+    # Drain stderr on a thread into a bounded buffer so a chatty FFmpeg can't
+    # fill the pipe (and block) while we are still writing to its stdin
+    stderr_tail: deque[str] = deque(maxlen=FFMPEG_STDERR_LINES)
+    assert proc.stderr is not None
+    reader = Thread(target=_drain_lines, args=(proc.stderr, stderr_tail), daemon=True)
+    reader.start()
+
+    if input_data is not None:
+        assert proc.stdin is not None
+        try:
+            proc.stdin.write(input_data)
+        except BrokenPipeError:
+            pass  # FFmpeg exited early; the return code and stderr say why
+        finally:
+            proc.stdin.close()
+
+    returncode = proc.wait()
+    reader.join()
+
+    stderr = "\n".join(stderr_tail)
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd, "", stderr)
+    return subprocess.CompletedProcess(cmd, returncode, "", stderr)
+
+
+def _drain_lines(stream: IO[bytes], lines: deque[str]) -> None:
+    """Read a byte stream to EOF, keeping decoded lines in a (bounded) deque."""
+    with stream:
+        for line in stream:
+            lines.append(line.decode(errors="replace").rstrip())
@@ -35,6 +35,7 @@ from __future__ import annotations
 
 import struct
 import tempfile
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -47,25 +48,49 @@ NAM_CLASS_ID = "F2AEE70D00DE4F4E534441613159456F"
 # Default NAM plugin version
 DEFAULT_NAM_VERSION = "0.7.13"
 
+# Static parts of the VST3 preset layout (see create_vst3_preset)
+_VST3_HEADER_SIZE = 48
+_VST3_MAGIC_VERSION = b"VST3" + struct.pack("<I", 1)
+_NAM_HEADER_PREFIX = _VST3_MAGIC_VERSION + NAM_CLASS_ID.encode("ascii")
+# Chunk list with a single "Comp" entry: ID (4) + offset (8) + size (8)
+_COMP_CHUNK_LIST_PREFIX = b"List" + struct.pack("<I", 1) + b"Comp"
+
 
 class PresetGenerationError(Exception):
     """Error during VST3 preset generation."""
 
 
-def _put_string(s: str) -> bytes:
+def _encode_string(s: str) -> bytes:
+    """
+    Encode a string payload for iPlug2's PutStr format.
+
+    Args:
+        s: String to encode
+
+    Returns:
+        String bytes + null terminator (empty for an empty string)
     """
-    Encode a string in iPlug2's PutStr format.
+    return s.encode("utf-8") + b"\x00" if s else b""
+
+
+def _put_string(buf: bytearray, offset: int, encoded: bytes) -> int:
+    """
+    Write an encoded string in iPlug2's PutStr format.
 
     Format: 4-byte length (little-endian) + string bytes + null terminator
 
     Args:
-        s: String to encode
+        buf: Buffer to write into
+        offset: Position to write at
+        encoded: Payload from _encode_string
 
     Returns:
-        Encoded bytes
+        Offset just past the written string
     """
-    encoded = s.encode("utf-8") + b"\x00" if s else b""
-    return struct.pack("<I", len(encoded)) + encoded
+    struct.pack_into("<I", buf, offset, len(encoded))
+    end = offset + 4 + len(encoded)
+    buf[offset + 4 : end] = encoded
+    return end
 
 
 def create_nam_state(
@@ -90,14 +115,6 @@ def create_nam_state(
     Returns:
         Binary state data for the VST3 preset
     """
-    state = b""
-
-    # Header strings (iPlug2 format)
-    state += _put_string("###NeuralAmpModeler###")
-    state += _put_string(version)
-    state += _put_string(nam_path)
-    state += _put_string(ir_path)
-
     # Default parameter values (v0.7.13 format) - normalized (0-1) values
     # Parameter order from NAM source:
     # Input, Threshold, Bass, Middle, Treble, Output,
@@ -122,10 +139,20 @@ def create_nam_state(
     if len(parameters) != 12:
         raise PresetGenerationError(f"Expected 12 parameters, got {len(parameters)}")
 
-    for param in parameters:
-        state += struct.pack("<d", float(param))  # double, little-endian
+    # Header strings (iPlug2 format)
+    strings = [_encode_string(s) for s in ("###NeuralAmpModeler###", version, nam_path, ir_path)]
+
+    # Size the buffer up front: length-prefixed strings + 12 doubles
+    state = bytearray(sum(4 + len(encoded) for encoded in strings) + 8 * len(parameters))
 
-    return state
+    offset = 0
+    for encoded in strings:
+        offset = _put_string(state, offset, encoded)
+
+    # Parameters as doubles, little-endian
+    struct.pack_into("<12d", state, offset, *(float(param) for param in parameters))
+
+    return bytes(state)
 
 
 def create_vst3_preset(class_id: str, component_state: bytes) -> bytes:
@@ -148,36 +175,25 @@ def create_vst3_preset(class_id: str, component_state: bytes) -> bytes:
     if len(class_id) != 32:
         raise PresetGenerationError(f"Class ID must be 32 characters, got {len(class_id)}")
 
-    # VST3 header components
-    magic = b"VST3"
-    version = 1
-    class_id_bytes = class_id.encode("ascii")
-
-    # Calculate offsets
-    header_size = 48
-    data_start = header_size
-    comp_offset = data_start
-    chunk_list_offset = data_start + len(component_state)
-
-    # Build chunk list
-    list_id = b"List"
-    num_entries = 1
-    chunk_list = list_id + struct.pack("<I", num_entries)
-
-    # Entry: ID (4) + offset (8) + size (8) = 20 bytes
-    comp_id = b"Comp"
-    chunk_list += comp_id
-    chunk_list += struct.pack("<Q", comp_offset)
-    chunk_list += struct.pack("<Q", len(component_state))
+    # Magic + version + class ID are constant for NAM presets
+    if class_id == NAM_CLASS_ID:
+        header_prefix = _NAM_HEADER_PREFIX
+    else:
+        header_prefix = _VST3_MAGIC_VERSION + class_id.encode("ascii")
 
-    # Build header
-    header = magic
-    header += struct.pack("<I", version)
-    header += class_id_bytes
-    header += struct.pack("<Q", chunk_list_offset)
+    # Component state starts right after the header, chunk list follows it
+    state_size = len(component_state)
+    chunk_list_offset = _VST3_HEADER_SIZE + state_size
 
-    # Combine all parts
-    return header + component_state + chunk_list
+    return b"".join(
+        (
+            header_prefix,
+            struct.pack("<Q", chunk_list_offset),
+            component_state,
+            _COMP_CHUNK_LIST_PREFIX,
+            struct.pack("<QQ", _VST3_HEADER_SIZE, state_size),
+        )
+    )
 
 
 def generate_nam_preset(
@@ -224,11 +240,10 @@ def generate_nam_preset(
         output_path = Path(output_preset_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Create the component state with model path
-    component_state = create_nam_state(str(model_path), ir_path=ir_path, parameters=parameters)
-
-    # Create the full preset
-    preset_data = create_vst3_preset(NAM_CLASS_ID, component_state)
+    # Create the full preset with the model path in its component state
+    preset_data = _cached_preset_bytes(
+        str(model_path), ir_path, None if parameters is None else tuple(parameters)
+    )
 
     # Write to file
     output_path.write_bytes(preset_data)
@@ -259,6 +274,17 @@ def generate_preset_bytes(
     if not model_path.exists():
         raise PresetGenerationError(f"NAM model not found: {model_path}")
 
-    component_state = create_nam_state(str(model_path), ir_path=ir_path, parameters=parameters)
+    return _cached_preset_bytes(
+        str(model_path), ir_path, None if parameters is None else tuple(parameters)
+    )
+
 
+@lru_cache(maxsize=128)
+def _cached_preset_bytes(
+    model_path: str,
+    ir_path: str,
+    parameters: tuple[float, ...] | None,
+) -> bytes:
+    """Build NAM preset bytes, memoized since segments often reuse a model."""
+    component_state = create_nam_state(model_path, ir_path=ir_path, parameters=parameters)
     return create_vst3_preset(NAM_CLASS_ID, component_state)
@@ -1 +1,110 @@
 """Pytest configuration."""
+
+from __future__ import annotations
+
+import functools
+import os
+import shutil
+import subprocess
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+from pedalboard.io import AudioFile
+
+from guitar_tone_shootout import pipeline
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+# Hardware H.264 encoders tried before falling back to libx264
+_HW_H264_ENCODERS = ("h264_nvenc", "h264_qsv", "h264_amf")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def single_threaded_ffmpeg_per_xdist_worker() -> Iterator[None]:
+    """Under pytest-xdist (-n), run FFmpeg single-threaded so workers don't oversubscribe."""
+    if "PYTEST_XDIST_WORKER" not in os.environ:
+        yield
+        return
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(pipeline, "FFMPEG_THREADS", 1)
+        mp.setattr(pipeline, "SEGMENT_WORKERS", 1)
+        yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def isolated_image_cache(tmp_path_factory: pytest.TempPathFactory) -> Iterator[None]:
+    """Keep rendered segment images in a session temp dir instead of the user's ~/.cache."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(pipeline, "IMAGE_CACHE_DIR", tmp_path_factory.mktemp("image_cache"))
+        yield
+
+
+@pytest.fixture(scope="session")
+def synthetic_wav_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """1 second mono 440Hz sine WAV at 44.1kHz, written once per session (do not modify)."""
+    path = tmp_path_factory.mktemp("audio_cache") / "sine_440hz.wav"
+    t = np.arange(44100, dtype=np.float32) / 44100
+    audio = (0.5 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+    with AudioFile(str(path), "w", samplerate=44100, num_channels=1) as af:
+        af.write(audio.reshape(1, -1))
+    return path
+
+
+@pytest.fixture(scope="session")
+def synthetic_ir_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """4096-sample delta IR WAV at 44.1kHz, written once per session (do not modify)."""
+    path = tmp_path_factory.mktemp("audio_cache") / "delta_ir.wav"
+    ir_data = np.zeros((1, 4096), dtype=np.float32)
+    ir_data[0, 0] = 1.0
+    with AudioFile(str(path), "w", samplerate=44100, num_channels=1) as af:
+        af.write(ir_data)
+    return path
+
+
+@functools.cache
+def _probe_encoders() -> frozenset[str]:
+    """Names of the encoders FFmpeg was built with (runs ffmpeg -encoders once)."""
+    if shutil.which("ffmpeg") is None:
+        return frozenset()
+
+    listing = subprocess.run(
+        ["ffmpeg", "-hide_banner", "-encoders"], capture_output=True, text=True, check=False
+    ).stdout
+    # Encoder lines look like " V....D libx264   description"; the header ends at "------"
+    _, _, table = listing.partition("------")
+    return frozenset(line.split()[1] for line in table.splitlines() if len(line.split()) > 1)
+
+
+@pytest.fixture(scope="session")
+def hw_encoder() -> str:
+    """First hardware H.264 encoder that can encode a frame on this host, else libx264."""
+    for encoder in _HW_H264_ENCODERS:
+        if encoder not in _probe_encoders():
+            continue
+        # Being compiled in doesn't mean a device is present: try one frame
+        trial = subprocess.run(
+            [
+                "ffmpeg",
+                "-hide_banner",
+                "-loglevel",
+                "error",
+                "-f",
+                "lavfi",
+                "-i",
+                "color=size=256x256:duration=0.04",
+                "-c:v",
+                encoder,
+                "-f",
+                "null",
+                "-",
+            ],
+            capture_output=True,
+            check=False,
+        )
+        if trial.returncode == 0:
+            return encoder
+    return "libx264"
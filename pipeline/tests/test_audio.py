@@ -3,9 +3,10 @@
 from pathlib import Path
 
 import numpy as np
+import pedalboard
 import pytest
-from pedalboard.io import AudioFile
 
+import guitar_tone_shootout.audio as audio_module
 from guitar_tone_shootout.audio import (
     NAM_VST3_ENV_VAR,
     AudioProcessingError,
@@ -17,22 +18,45 @@ from guitar_tone_shootout.audio import (
     load_nam_via_vst3,
     process_chain,
     save_audio,
+    trim_silence_array,
 )
 from guitar_tone_shootout.config import ChainEffect
+from guitar_tone_shootout.normalize import rms_db
+
+_RNG = np.random.default_rng(0)
+
+
+def _random_audio(n: int, scale: float = 0.5) -> np.ndarray:
+    """Gaussian noise filled straight into a float32 buffer (no float64 temporary)."""
+    out = np.empty(n, dtype=np.float32)
+    _RNG.standard_normal(dtype=np.float32, out=out)
+    out *= scale
+    return out
+
+
+def _sine(
+    n: int, freq: float = 440.0, amplitude: float = 1.0, sample_rate: int = 44100
+) -> np.ndarray:
+    """Sine built in place in a float32 buffer from an integer sample index."""
+    out = np.arange(n, dtype=np.float32)
+    out *= 2 * np.pi * freq / sample_rate
+    np.sin(out, out=out)
+    out *= amplitude
+    return out
+
+
+def _peak(audio: np.ndarray) -> float:
+    """Absolute peak from two reductions, without allocating an np.abs temporary."""
+    return float(max(audio.max(), -audio.min()))
+
 
 # =============================================================================
 # Audio I/O Tests
 # =============================================================================
 
 
-def test_load_audio(tmp_path: Path) -> None:
-    # Create a test WAV file
-    audio_path = tmp_path / "test.wav"
-    test_audio = np.random.randn(1, 44100).astype(np.float32) * 0.5
-    with AudioFile(str(audio_path), "w", samplerate=44100, num_channels=1) as af:
-        af.write(test_audio)
-
-    audio, sample_rate = load_audio(audio_path)
+def test_load_audio(synthetic_wav_path: Path) -> None:
+    audio, sample_rate = load_audio(synthetic_wav_path)
 
     assert sample_rate == 44100
     assert audio.ndim == 1  # Should be mono
@@ -47,18 +71,17 @@ def test_load_audio_missing_raises() -> None:
 
 def test_save_audio(tmp_path: Path) -> None:
     output_path = tmp_path / "test.flac"
-    test_audio = np.random.randn(44100).astype(np.float32) * 0.5
+    test_audio = _random_audio(44100)
 
     result = save_audio(test_audio, output_path, 44100)
 
     assert result == output_path
-    assert output_path.exists()
     assert output_path.stat().st_size > 0
 
 
 def test_save_audio_creates_parent_dirs(tmp_path: Path) -> None:
     output_path = tmp_path / "nested" / "dir" / "test.flac"
-    test_audio = np.random.randn(1000).astype(np.float32)
+    test_audio = _random_audio(1000, scale=1.0)
 
     result = save_audio(test_audio, output_path, 44100)
 
@@ -66,9 +89,22 @@ def test_save_audio_creates_parent_dirs(tmp_path: Path) -> None:
 
 
 def test_save_and_reload_lossless(tmp_path: Path) -> None:
-    """FLAC round-trip should preserve audio data."""
+    """WAV round-trip should preserve audio data."""
+    output_path = tmp_path / "test.wav"
+    original = _sine(44100)
+
+    save_audio(original, output_path, 44100)
+    reloaded, sr = load_audio(output_path)
+
+    assert sr == 44100
+    assert len(reloaded) == len(original)
+    assert _peak(original - reloaded) < 1e-4
+
+
+def test_flac_roundtrip_tolerance(tmp_path: Path) -> None:
+    """FLAC round-trip should stay within the encoder's quantization error."""
     output_path = tmp_path / "test.flac"
-    original = np.sin(2 * np.pi * 440 * np.linspace(0, 1, 44100)).astype(np.float32)
+    original = _sine(4410)
 
     save_audio(original, output_path, 44100)
     reloaded, sr = load_audio(output_path)
@@ -78,20 +114,40 @@ def test_save_and_reload_lossless(tmp_path: Path) -> None:
     np.testing.assert_allclose(original, reloaded, rtol=0.05, atol=1e-4)
 
 
+def test_trim_silence_array_crops_to_active_region() -> None:
+    audio = np.zeros(44100, dtype=np.float32)
+    audio[10000:20000] = 0.5
+
+    trimmed = trim_silence_array(audio, 44100, min_silence=0.01)
+
+    # 441 samples (10ms) of silence kept either side of the active region
+    assert len(trimmed) == 10000 + 2 * 441
+    assert trimmed[441] == 0.5
+    assert trimmed[-442] == 0.5
+
+
+def test_trim_silence_array_silent_returns_empty() -> None:
+    audio = np.zeros(44100, dtype=np.float32)
+
+    assert len(trim_silence_array(audio, 44100)) == 0
+
+
+def test_trim_silence_array_stereo_uses_loudest_channel() -> None:
+    audio = np.zeros((2, 44100), dtype=np.float32)
+    audio[1, 5000:6000] = 0.5
+
+    trimmed = trim_silence_array(audio, 44100, min_silence=0.0)
+
+    assert trimmed.shape == (2, 1000)
+
+
 # =============================================================================
 # IR Loading Tests
 # =============================================================================
 
 
-def test_load_ir(tmp_path: Path) -> None:
-    # Create a simple IR file (impulse)
-    ir_path = tmp_path / "test_ir.wav"
-    ir_data = np.zeros((1, 4096), dtype=np.float32)
-    ir_data[0, 0] = 1.0  # Delta function
-    with AudioFile(str(ir_path), "w", samplerate=48000, num_channels=1) as af:
-        af.write(ir_data)
-
-    convolution = load_ir(ir_path)
+def test_load_ir(synthetic_ir_path: Path) -> None:
+    convolution = load_ir(synthetic_ir_path)
 
     assert convolution is not None
 
@@ -126,8 +182,6 @@ def test_load_nam_model_invalid_json_raises(tmp_path: Path) -> None:
 
 def test_find_nam_vst3_env_var(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     """Should find VST3 via environment variable."""
-    import guitar_tone_shootout.audio as audio_module
-
     # Reset cached path
     audio_module._nam_vst3_path = None
 
@@ -145,10 +199,31 @@ def test_find_nam_vst3_env_var(tmp_path: Path, monkeypatch: pytest.MonkeyPatch)
     audio_module._nam_vst3_path = None
 
 
+def test_load_nam_via_vst3_reuses_plugin(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Loading the same model twice should only instantiate the plugin once."""
+    loaded: list[str] = []
+
+    class FakePlugin:
+        preset_data = b""
+
+    def fake_load_plugin(path: str) -> FakePlugin:
+        loaded.append(path)
+        return FakePlugin()
+
+    monkeypatch.setattr(pedalboard, "load_plugin", fake_load_plugin, raising=False)
+
+    model = tmp_path / "reuse.nam"
+    model.write_text("{}")
+
+    first = load_nam_via_vst3(model, vst3_path="/fake/NAM.vst3")
+    second = load_nam_via_vst3(model, vst3_path="/fake/NAM.vst3")
+
+    assert first is second
+    assert loaded == ["/fake/NAM.vst3"]
+
+
 def test_find_nam_vst3_not_found(monkeypatch: pytest.MonkeyPatch) -> None:
     """Should return None if VST3 not found."""
-    import guitar_tone_shootout.audio as audio_module
-
     # Reset cached path
     audio_module._nam_vst3_path = None
 
@@ -176,8 +251,6 @@ def test_load_nam_via_vst3_missing_model(tmp_path: Path) -> None:
 
 def test_load_nam_via_vst3_no_vst3(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     """Should return None if VST3 is not available."""
-    import guitar_tone_shootout.audio as audio_module
-
     # Reset cached path and mock find_nam_vst3 to return None
     audio_module._nam_vst3_path = None
     monkeypatch.setattr(audio_module, "find_nam_vst3", lambda: None)
@@ -232,11 +305,14 @@ def test_create_effect_invalid_returns_none(effect_type: str, value: str) -> Non
 # =============================================================================
 
 
-@pytest.fixture
+# Synthetic signals are built once per session and returned read-only;
+# copy one before modifying it in a test.
+@pytest.fixture(scope="session")
 def sample_audio() -> np.ndarray:
     """1 second of 440Hz sine wave."""
-    t = np.linspace(0, 1, 44100, endpoint=False)
-    return (0.5 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+    audio = _sine(44100, amplitude=0.5)
+    audio.setflags(write=False)
+    return audio
 
 
 def test_process_chain_eq(sample_audio: np.ndarray) -> None:
@@ -254,7 +330,7 @@ def test_process_chain_gain(sample_audio: np.ndarray) -> None:
     processed = process_chain(sample_audio, 44100, chain)
 
     # +6dB should roughly double amplitude
-    assert np.max(np.abs(processed)) > np.max(np.abs(sample_audio))
+    assert _peak(processed) > _peak(sample_audio)
 
 
 def test_process_chain_reverb(sample_audio: np.ndarray) -> None:
@@ -267,33 +343,40 @@ def test_process_chain_reverb(sample_audio: np.ndarray) -> None:
     assert len(processed) >= len(sample_audio)
 
 
-def test_process_chain_with_ir(sample_audio: np.ndarray, tmp_path: Path) -> None:
-    # Create a test IR
-    ir_path = tmp_path / "test_ir.wav"
-    ir_data = np.zeros((1, 4096), dtype=np.float32)
-    ir_data[0, 0] = 1.0
-    with AudioFile(str(ir_path), "w", samplerate=44100, num_channels=1) as af:
-        af.write(ir_data)
-
-    chain = [ChainEffect(effect_type="ir", value=str(ir_path))]
+def test_process_chain_with_ir(sample_audio: np.ndarray, synthetic_ir_path: Path) -> None:
+    chain = [ChainEffect(effect_type="ir", value=str(synthetic_ir_path))]
 
     processed = process_chain(sample_audio, 44100, chain)
 
-    assert processed is not None
     assert processed.dtype == np.float32
+    # A delta IR is an identity convolution, up to the convolver's IR normalization gain
+    gain = np.dot(processed, sample_audio) / np.dot(sample_audio, sample_audio)
+    np.testing.assert_allclose(processed, gain * sample_audio, atol=1e-5)
+
+
+def test_process_chain_ir_is_fft_convolution(tmp_path: Path) -> None:
+    """IR convolution should match an FFT convolution of the signal with the IR."""
+    rng = np.random.default_rng(0)
+    audio = rng.standard_normal(441000, dtype=np.float32) * 0.1  # 10 seconds
+    decay = np.exp(-np.arange(8192, dtype=np.float32) / 1000)
+    ir_path = save_audio(
+        rng.standard_normal(8192, dtype=np.float32) * decay, tmp_path / "ir.wav", 44100
+    )
+    ir, _ = load_audio(ir_path)
 
+    processed = process_chain(audio, 44100, [ChainEffect(effect_type="ir", value=str(ir_path))])
 
-def test_process_chain_multiple_effects(sample_audio: np.ndarray, tmp_path: Path) -> None:
-    # Create a test IR
-    ir_path = tmp_path / "test_ir.wav"
-    ir_data = np.zeros((1, 4096), dtype=np.float32)
-    ir_data[0, 0] = 1.0
-    with AudioFile(str(ir_path), "w", samplerate=44100, num_channels=1) as af:
-        af.write(ir_data)
+    size = 1 << (len(audio) + len(ir) - 2).bit_length()
+    reference = np.fft.irfft(np.fft.rfft(audio, size) * np.fft.rfft(ir, size), size)[: len(audio)]
+    # The convolver normalizes the IR, so compare after fitting the gain
+    gain = np.dot(processed, reference) / np.dot(reference, reference)
+    np.testing.assert_allclose(processed, gain * reference, atol=1e-5)
 
+
+def test_process_chain_multiple_effects(sample_audio: np.ndarray, synthetic_ir_path: Path) -> None:
     chain = [
         ChainEffect(effect_type="eq", value="highpass_80hz"),
-        ChainEffect(effect_type="ir", value=str(ir_path)),
+        ChainEffect(effect_type="ir", value=str(synthetic_ir_path)),
         ChainEffect(effect_type="gain", value="-3.0"),
     ]
 
@@ -305,8 +388,6 @@ def test_process_chain_multiple_effects(sample_audio: np.ndarray, tmp_path: Path
 
 def test_process_chain_with_normalization(sample_audio: np.ndarray) -> None:
     """Test input and output normalization in process_chain."""
-    from guitar_tone_shootout.normalize import rms_db
-
     chain = [ChainEffect(effect_type="gain", value="0.0")]  # Unity gain
 
     # Process with output normalization
@@ -0,0 +1,63 @@
+"""Tests for Pillow title card rendering."""
+
+from pathlib import Path
+
+from PIL import Image
+
+from guitar_tone_shootout.card import (
+    CARD_HEIGHT,
+    CARD_WIDTH,
+    CardContent,
+    _fit_text,
+    _font,
+    render_card,
+)
+
+
+def _content(**overrides: str) -> CardContent:
+    fields = {
+        "comparison_name": "Marshall Shootout",
+        "signal_chain_name": "JCM800 Crunch",
+        "signal_chain_description": "Classic rock crunch",
+        "guitar": "Fender Strat",
+        "pickup": "Bridge",
+        "amp_name": "JCM800 capture 3",
+        "amp_source": "Tone3000",
+        "cab_name": "Greenback 4x12",
+        "cab_source": "",
+        "author": "Tester",
+    }
+    fields.update(overrides)
+    return CardContent(**fields)
+
+
+def test_render_card_png(tmp_path: Path) -> None:
+    output = render_card(_content(), tmp_path / "card.png")
+
+    with Image.open(output) as img:
+        assert img.format == "PNG"
+        assert img.size == (CARD_WIDTH, CARD_HEIGHT)
+
+
+def test_render_card_jpeg_creates_dirs(tmp_path: Path) -> None:
+    output = render_card(_content(signal_chain_description=""), tmp_path / "nested" / "card.jpg")
+
+    with Image.open(output) as img:
+        assert img.format == "JPEG"
+
+
+def test_render_card_long_values(tmp_path: Path) -> None:
+    """Long names are truncated rather than overflowing the card."""
+    output = render_card(_content(amp_name="Very Long Capture Name " * 10), tmp_path / "card.png")
+
+    assert output.exists()
+
+
+def test_fit_text_truncates_with_ellipsis() -> None:
+    font = _font(26)
+
+    assert _fit_text("short", font, 500) == "short"
+
+    fitted = _fit_text("a much longer piece of text " * 5, font, 200)
+    assert fitted.endswith("…")
+    assert font.getlength(fitted) <= 200
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import numpy as np
 import pytest
+from pydantic import ValidationError
 
 from guitar_tone_shootout.metrics import (
     AdvancedMetrics,
@@ -24,6 +25,7 @@ from guitar_tone_shootout.metrics import (
     extract_advanced_metrics,
     extract_core_metrics,
     extract_metrics,
+    extract_metrics_batch,
     extract_spectral_metrics,
 )
 
@@ -31,89 +33,110 @@ from guitar_tone_shootout.metrics import (
 # Test Fixtures
 # =============================================================================
 
+# Synthetic signals are built once per session and returned read-only;
+# copy one before modifying it in a test.
 
-@pytest.fixture
+# One second of sample times at 44.1 kHz, shared by the sine fixtures
+_TIME_AXIS = np.arange(44100, dtype=np.float32) / np.float32(44100)
+_TIME_AXIS.setflags(write=False)
+
+
+def _sine(freq: float, amplitude: float = 0.5) -> np.ndarray:
+    """Read-only 1 second float32 sine on the shared time axis."""
+    audio = _TIME_AXIS * np.float32(2 * np.pi * freq)
+    np.sin(audio, out=audio)
+    audio *= amplitude
+    audio.setflags(write=False)
+    return audio
+
+
+@pytest.fixture(scope="session")
 def sine_440hz() -> np.ndarray:
     """1 second of 440Hz sine wave at 0.5 amplitude."""
-    sample_rate = 44100
-    t = np.linspace(0, 1, sample_rate, endpoint=False)
-    return (0.5 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+    return _sine(440)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sine_1khz() -> np.ndarray:
     """1 second of 1kHz sine wave at 0.5 amplitude."""
-    sample_rate = 44100
-    t = np.linspace(0, 1, sample_rate, endpoint=False)
-    return (0.5 * np.sin(2 * np.pi * 1000 * t)).astype(np.float32)
+    return _sine(1000)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sine_100hz() -> np.ndarray:
     """1 second of 100Hz sine wave at 0.5 amplitude."""
-    sample_rate = 44100
-    t = np.linspace(0, 1, sample_rate, endpoint=False)
-    return (0.5 * np.sin(2 * np.pi * 100 * t)).astype(np.float32)
+    return _sine(100)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sine_5khz() -> np.ndarray:
     """1 second of 5kHz sine wave at 0.5 amplitude."""
-    sample_rate = 44100
-    t = np.linspace(0, 1, sample_rate, endpoint=False)
-    return (0.5 * np.sin(2 * np.pi * 5000 * t)).astype(np.float32)
+    return _sine(5000)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def impulse() -> np.ndarray:
     """Single sample impulse (maximum crest factor)."""
     audio = np.zeros(44100, dtype=np.float32)
     audio[22050] = 1.0
+    audio.setflags(write=False)
     return audio
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def decaying_sine() -> np.ndarray:
     """Decaying sine wave for attack/sustain testing."""
     sample_rate = 44100
-    t = np.linspace(0, 2, sample_rate * 2, endpoint=False)
-    # Exponential decay envelope
-    envelope = np.exp(-2 * t)
+    t = np.arange(sample_rate * 2, dtype=np.float32) / sample_rate
     # 440Hz sine wave
-    signal = np.sin(2 * np.pi * 440 * t)
-    return (envelope * signal * 0.9).astype(np.float32)
+    audio = t * np.float32(2 * np.pi * 440)
+    np.sin(audio, out=audio)
+    # Exponential decay envelope
+    audio *= np.exp(-2 * t)
+    audio *= 0.9
+    audio.setflags(write=False)
+    return audio
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def transient_signal() -> np.ndarray:
     """Signal with clear transients (simulated drum hits)."""
     sample_rate = 44100
     duration = 2  # 2 seconds
     audio = np.zeros(sample_rate * duration, dtype=np.float32)
 
+    # Create a short burst (50ms decay), shared by every transient
+    burst_len = int(0.05 * sample_rate)
+    t = np.linspace(0, 0.05, burst_len, dtype=np.float32)
+    burst = t * np.float32(2 * np.pi * 200)
+    np.sin(burst, out=burst)
+    burst *= np.exp(-50 * t)
+    burst *= 0.8
+
     # Add 4 transients at 0.25s, 0.75s, 1.25s, 1.75s
     for time_s in [0.25, 0.75, 1.25, 1.75]:
         idx = int(time_s * sample_rate)
-        # Create a short burst (50ms decay)
-        burst_len = int(0.05 * sample_rate)
-        t = np.linspace(0, 0.05, burst_len)
-        burst = np.exp(-50 * t) * np.sin(2 * np.pi * 200 * t)
-        audio[idx : idx + burst_len] += burst.astype(np.float32) * 0.8
+        audio[idx : idx + burst_len] += burst
 
+    audio.setflags(write=False)
     return audio
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def silent_audio() -> np.ndarray:
     """Completely silent audio."""
-    return np.zeros(44100, dtype=np.float32)
+    audio = np.zeros(44100, dtype=np.float32)
+    audio.setflags(write=False)
+    return audio
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def noise() -> np.ndarray:
     """White noise at moderate level."""
-    np.random.seed(42)  # Reproducible
-    return (np.random.randn(44100) * 0.3).astype(np.float32)
+    rng = np.random.default_rng(42)  # Reproducible, without touching global state
+    audio = rng.standard_normal(44100, dtype=np.float32) * 0.3
+    audio.setflags(write=False)
+    return audio
 
 
 # =============================================================================
@@ -138,8 +161,7 @@ class TestRmsDbfs:
 
     def test_full_scale_sine(self) -> None:
         """Full scale sine wave should be about -3 dBFS RMS."""
-        t = np.linspace(0, 1, 44100, endpoint=False)
-        audio = np.sin(2 * np.pi * 440 * t).astype(np.float32)
+        audio = _sine(440, amplitude=1.0)
         rms = calculate_rms_dbfs(audio)
         # 1.0 / sqrt(2) ~= 0.707, 20 * log10(0.707) ~= -3.01
         assert -4 < rms < -2
@@ -196,9 +218,9 @@ class TestDynamicRange:
     def test_varying_amplitude_higher_dynamic_range(self) -> None:
         """Signal with varying amplitude should show dynamic range."""
         # Create signal with loud and quiet parts
-        loud = np.sin(2 * np.pi * 440 * np.linspace(0, 0.5, 22050)) * 0.9
-        quiet = np.sin(2 * np.pi * 440 * np.linspace(0, 0.5, 22050)) * 0.1
-        audio = np.concatenate([loud, quiet]).astype(np.float32)
+        loud = _sine(440, amplitude=0.9)[:22050]
+        quiet = _sine(440, amplitude=0.1)[:22050]
+        audio = np.concatenate([loud, quiet])
 
         dr = calculate_dynamic_range_db(audio, 44100)
         # 20 * log10(0.9/0.1) ~= 19 dB, but with windowing expect less
@@ -312,9 +334,8 @@ class TestLufsIntegrated:
 
     def test_quieter_audio_lower_lufs(self) -> None:
         """Quieter audio should have lower LUFS."""
-        t = np.linspace(0, 1, 44100, endpoint=False)
-        loud = np.sin(2 * np.pi * 440 * t).astype(np.float32) * 0.8
-        quiet = np.sin(2 * np.pi * 440 * t).astype(np.float32) * 0.1
+        loud = _sine(440, amplitude=0.8)
+        quiet = _sine(440, amplitude=0.1)
 
         lufs_loud = calculate_lufs_integrated(loud, 44100)
         lufs_quiet = calculate_lufs_integrated(quiet, 44100)
@@ -449,15 +470,56 @@ class TestExtractMetrics:
         assert "spectral_centroid_hz" in json_str
         assert "lufs_integrated" in json_str
 
+    def test_models_are_immutable(self, sine_440hz: np.ndarray) -> None:
+        """Extracted metrics should reject attribute assignment."""
+        metrics = extract_metrics(sine_440hz, 44100)
+        with pytest.raises(ValidationError):
+            metrics.core.rms_dbfs = 0.0  # type: ignore[misc]
+        with pytest.raises(ValidationError):
+            metrics.sample_rate = 48000  # type: ignore[misc]
+
     def test_2d_array_handled(self) -> None:
         """Should handle 2D arrays by flattening."""
-        audio = np.random.randn(2, 22050).astype(np.float32) * 0.3
+        audio = np.random.default_rng(0).standard_normal((2, 22050), dtype=np.float32) * 0.3
         metrics = extract_metrics(audio, 44100)
         assert isinstance(metrics, AudioMetrics)
         # Duration should reflect flattened length
         assert metrics.duration_seconds == pytest.approx(1.0, rel=0.01)
 
 
+class TestExtractMetricsBatch:
+    """Tests for extract_metrics_batch function."""
+
+    def test_matches_per_segment_extraction(
+        self, sine_440hz: np.ndarray, sine_5khz: np.ndarray, noise: np.ndarray
+    ) -> None:
+        """Each row should match the per-group extractors run on that row alone."""
+        segments = np.stack([sine_440hz, sine_5khz, noise])
+        batch = extract_metrics_batch(segments, 44100)
+
+        assert len(batch) == 3
+        for row, metrics in zip(segments, batch, strict=True):
+            assert metrics.core == extract_core_metrics(row, 44100)
+            assert metrics.spectral == extract_spectral_metrics(row, 44100)
+            assert metrics.advanced == extract_advanced_metrics(row, 44100)
+
+    def test_silent_segment_neg_inf(
+        self, sine_440hz: np.ndarray, silent_audio: np.ndarray
+    ) -> None:
+        """A silent row should keep the -inf levels without affecting others."""
+        loud, silent = extract_metrics_batch(np.stack([sine_440hz, silent_audio]), 44100)
+
+        assert silent.core.rms_dbfs == float("-inf")
+        assert silent.core.peak_dbfs == float("-inf")
+        assert silent.core.crest_factor_db == 0.0
+        assert np.isfinite(loud.core.rms_dbfs)
+
+    def test_1d_array_rejected(self, sine_440hz: np.ndarray) -> None:
+        """Should require a 2D (n_segments, n_samples) array."""
+        with pytest.raises(ValueError, match="2D"):
+            extract_metrics_batch(sine_440hz, 44100)
+
+
 class TestCompareMetrics:
     """Tests for compare_metrics function."""
 
@@ -524,8 +586,9 @@ class TestEdgeCases:
 
     def test_different_sample_rates(self) -> None:
         """Should work with different sample rates."""
-        t = np.linspace(0, 1, 48000, endpoint=False)
-        audio = (np.sin(2 * np.pi * 440 * t) * 0.5).astype(np.float32)
+        audio = np.arange(48000, dtype=np.float32) * np.float32(2 * np.pi * 440 / 48000)
+        np.sin(audio, out=audio)
+        audio *= 0.5
 
         metrics = extract_metrics(audio, 48000)
         assert metrics.sample_rate == 48000
@@ -533,8 +596,7 @@ class TestEdgeCases:
 
     def test_clipped_audio(self) -> None:
         """Should handle clipped audio."""
-        t = np.linspace(0, 1, 44100, endpoint=False)
-        audio = np.clip(np.sin(2 * np.pi * 440 * t) * 2, -1, 1).astype(np.float32)
+        audio = np.clip(_sine(440, amplitude=2.0), -1, 1)
 
         metrics = extract_metrics(audio, 44100)
         # Peak should be at 0 dBFS
@@ -542,8 +604,7 @@ class TestEdgeCases:
 
     def test_dc_offset_audio(self) -> None:
         """Should handle audio with DC offset."""
-        t = np.linspace(0, 1, 44100, endpoint=False)
-        audio = (np.sin(2 * np.pi * 440 * t) * 0.3 + 0.2).astype(np.float32)
+        audio = _sine(440, amplitude=0.3) + np.float32(0.2)
 
         metrics = extract_metrics(audio, 44100)
         assert isinstance(metrics, AudioMetrics)
@@ -23,32 +23,43 @@ from guitar_tone_shootout.normalize import (
 # Test Fixtures
 # =============================================================================
 
+# Synthetic signals are built once per session and returned read-only;
+# copy one before modifying it in a test.
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def sample_audio() -> np.ndarray:
     """1 second of 440Hz sine wave at moderate level."""
-    t = np.linspace(0, 1, 44100, endpoint=False)
-    return (0.3 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+    t = np.arange(44100, dtype=np.float32) / 44100
+    audio = (0.3 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+    audio.setflags(write=False)
+    return audio
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def quiet_audio() -> np.ndarray:
     """Very quiet audio signal."""
-    t = np.linspace(0, 1, 44100, endpoint=False)
-    return (0.01 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+    t = np.arange(44100, dtype=np.float32) / 44100
+    audio = (0.01 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+    audio.setflags(write=False)
+    return audio
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def loud_audio() -> np.ndarray:
     """Loud audio signal near clipping."""
-    t = np.linspace(0, 1, 44100, endpoint=False)
-    return (0.9 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+    t = np.arange(44100, dtype=np.float32) / 44100
+    audio = (0.9 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+    audio.setflags(write=False)
+    return audio
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def silent_audio() -> np.ndarray:
     """Completely silent audio."""
-    return np.zeros(44100, dtype=np.float32)
+    audio = np.zeros(44100, dtype=np.float32)
+    audio.setflags(write=False)
+    return audio
 
 
 # =============================================================================
@@ -208,7 +219,7 @@ def test_normalize_rms_preserves_shape(sample_audio: np.ndarray) -> None:
 
 def test_normalize_rms_2d_preserves_shape() -> None:
     """Should preserve 2D shape."""
-    audio_2d = np.random.randn(1, 44100).astype(np.float32) * 0.3
+    audio_2d = np.random.default_rng(0).standard_normal((1, 44100), dtype=np.float32) * 0.3
     normalized = normalize_rms(audio_2d)
     assert normalized.shape == audio_2d.shape
 
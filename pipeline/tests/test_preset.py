@@ -1,5 +1,6 @@
 """Tests for VST3 preset generation."""
 
+import struct
 from pathlib import Path
 
 import pytest
@@ -51,6 +52,23 @@ def test_create_nam_state_with_parameters() -> None:
     assert len(state) > 0
 
 
+def test_create_nam_state_layout() -> None:
+    """State is four length-prefixed strings followed by 12 doubles."""
+    params = [i / 11 for i in range(12)]
+    state = create_nam_state("/m.nam", version="0.7.13", parameters=params)
+
+    offset = 0
+    strings = []
+    for _ in range(4):
+        (length,) = struct.unpack_from("<I", state, offset)
+        strings.append(state[offset + 4 : offset + 4 + length])
+        offset += 4 + length
+
+    assert strings == [b"###NeuralAmpModeler###\x00", b"0.7.13\x00", b"/m.nam\x00", b""]
+    assert list(struct.unpack_from("<12d", state, offset)) == params
+    assert len(state) == offset + 96
+
+
 def test_create_nam_state_wrong_param_count_raises() -> None:
     """Should raise if wrong number of parameters."""
     with pytest.raises(PresetGenerationError, match="Expected 12 parameters"):
@@ -98,6 +116,21 @@ def test_create_vst3_preset_contains_state() -> None:
     assert state in preset
 
 
+def test_create_vst3_preset_chunk_list_offsets() -> None:
+    """Header offset points at the chunk list, whose entry points at the state."""
+    state = b"component-state"
+    preset = create_vst3_preset(NAM_CLASS_ID, state)
+
+    chunk_list_offset = int.from_bytes(preset[40:48], "little")
+    assert preset[chunk_list_offset : chunk_list_offset + 4] == b"List"
+
+    entry = preset[chunk_list_offset + 8 :]
+    assert entry[:4] == b"Comp"
+    comp_offset = int.from_bytes(entry[4:12], "little")
+    comp_size = int.from_bytes(entry[12:20], "little")
+    assert preset[comp_offset : comp_offset + comp_size] == state
+
+
 # =============================================================================
 # Preset Generation Tests
 # =============================================================================
@@ -112,7 +145,6 @@ def test_generate_nam_preset(tmp_path: Path) -> None:
     result = generate_nam_preset(model_path, preset_path)
 
     assert result == preset_path
-    assert preset_path.exists()
     assert preset_path.stat().st_size > 0
 
     # Verify it's a valid VST3 preset
@@ -163,6 +195,18 @@ def test_generate_preset_bytes(tmp_path: Path) -> None:
     assert str(model_path).encode() in data
 
 
+def test_generate_preset_bytes_reused_for_same_model(tmp_path: Path) -> None:
+    """Repeated calls for the same model return the memoized bytes."""
+    model_path = tmp_path / "model.nam"
+    model_path.write_text("{}")
+
+    first = generate_preset_bytes(model_path)
+    second = generate_preset_bytes(str(model_path))
+
+    assert first is second
+    assert generate_preset_bytes(model_path, parameters=[0.5] * 12) != first
+
+
 def test_generate_preset_bytes_missing_model() -> None:
     """Should raise if model file doesn't exist."""
     with pytest.raises(PresetGenerationError, match="NAM model not found"):
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 import os
+import shutil
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -19,8 +21,13 @@ if TYPE_CHECKING:
     from collections.abc import Generator
 
 
+# The default (Pillow) card renderer only needs FFmpeg
+_HAS_FFMPEG = shutil.which("ffmpeg") is not None
+
+
+@functools.cache
 def playwright_available() -> bool:
-    """Check if Playwright with Chromium is available."""
+    """Check if Playwright with Chromium is available (launches it once per session)."""
     try:
         from playwright.sync_api import sync_playwright
 
@@ -37,6 +44,13 @@ def playwright_available() -> bool:
 # =============================================================================
 
 
+@pytest.fixture
+def requires_playwright() -> None:
+    """Skip unless Chromium launches; probed on first use, not at collection."""
+    if not playwright_available():
+        pytest.skip("Playwright not available")
+
+
 @pytest.fixture
 def e2e_environment(tmp_path: Path) -> Generator[dict[str, Path], None, None]:
     """Set up a complete test environment with DI track and IR."""
@@ -50,7 +64,7 @@ def e2e_environment(tmp_path: Path) -> Generator[dict[str, Path], None, None]:
     # Create test DI track (1 second of audio)
     di_path = inputs / "di_tracks" / "test_di.wav"
     sample_rate = 44100
-    t = np.linspace(0, 1, sample_rate, endpoint=False)
+    t = np.arange(sample_rate, dtype=np.float32) / sample_rate
     audio = (0.5 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
     with AudioFile(str(di_path), "w", samplerate=sample_rate, num_channels=1) as af:
         af.write(audio.reshape(1, -1))
@@ -103,7 +117,7 @@ author = test_suite
 # =============================================================================
 
 
-@pytest.mark.skipif(not playwright_available(), reason="Playwright not available")
+@pytest.mark.skipif(not _HAS_FFMPEG, reason="FFmpeg not available")
 def test_full_comparison_workflow(e2e_environment: dict[str, Path]) -> None:
     """Test complete comparison workflow generates all expected outputs."""
     ini_path = e2e_environment["ini"]
@@ -114,7 +128,6 @@ def test_full_comparison_workflow(e2e_environment: dict[str, Path]) -> None:
     video_path = process_comparison(comparison)
 
     # Verify main video
-    assert video_path.exists()
     assert video_path.stat().st_size > 0
 
     # Verify output structure
@@ -126,15 +139,26 @@ def test_full_comparison_workflow(e2e_environment: dict[str, Path]) -> None:
         output_dir / "e2e_test.mp4",
         output_dir / "audio" / "e2e_test_000.flac",
         output_dir / "audio" / "e2e_test_full.flac",
-        output_dir / "images" / "e2e_test_000.png",
+        output_dir / "images" / "e2e_test_000.jpg",
         output_dir / "clips" / "e2e_test_000.mp4",
     ]
 
     for path in expected:
-        assert path.exists(), f"Missing: {path}"
         assert path.stat().st_size > 0, f"Empty: {path}"
 
 
+@pytest.mark.skipif(not _HAS_FFMPEG, reason="FFmpeg not available")
+@pytest.mark.usefixtures("requires_playwright")
+def test_full_comparison_workflow_html_renderer(e2e_environment: dict[str, Path]) -> None:
+    """Test the workflow with cards rendered from the HTML template."""
+    comparison = load_comparison(e2e_environment["ini"])
+    video_path = process_comparison(comparison, renderer="html")
+
+    assert video_path.exists()
+    image = e2e_environment["outputs"] / "e2e_test" / "images" / "e2e_test_000.jpg"
+    assert image.stat().st_size > 0
+
+
 # =============================================================================
 # CLI Tests
 # =============================================================================